@@ -1,11 +1,13 @@
 import logging
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from typing import Dict, Any, AsyncIterator, Iterable, List, Optional, Tuple
+from datetime import date, datetime
 import os
-import pandas as pd
-import aiohttp
+import csv
+import importlib.util
+import httpx
+import numpy as np
+from bs4 import BeautifulSoup
 from tqdm import tqdm
-from openai import AsyncOpenAI
 from .pydantic_models import (
     FundingAnnouncement,
     SourceReliability,
@@ -13,51 +15,309 @@ from .pydantic_models import (
     VerificationStatus,
     Discrepancy
 )
+from .models import FundingDetails
+from .clients import get_client
+from .parallel import run_parallel
+from .rate_limiter import TokenBucket, wait_retry_after
 import asyncio
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, stop_after_attempt
 import time
 import json
+import orjson
+import re
+from collections import OrderedDict
+from itertools import islice
+from urllib.parse import urlparse
+
+# Browser User-Agent for publishers that reject non-browser clients
+UA_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# HTTP/2 needs the optional h2 package; without it httpx speaks HTTP/1.1
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+# Characters of page content kept per URL; prompts only ever use the start of a page
+MAX_CONTENT_LENGTH = 50_000
+
+RESULTS_FILE = 'reports/verification_results.csv'
+SUMMARY_FILE = 'reports/verification_summary.csv'
+RESULTS_FIELDS = list(VerificationResult.model_fields)
+
+# Bytes of HTML read per page before the rest of the body is skipped
+MAX_DOWNLOAD_BYTES = 256 * 1024
+
+# Static rubrics are sent as system messages, byte-identical on every call,
+# so the API's automatic prompt caching can reuse the shared prefix
+_RELIABILITY_SYSTEM = """Perform a comprehensive analysis of the news source provided by the user.
+
+Please evaluate:
+1. Domain Reputation:
+   - Is this a well-known financial/business news source?
+   - Check for professional domain and established presence
+   - Assess editorial standards and fact-checking practices
+
+2. Content Quality:
+   - Writing professionalism and clarity
+   - Use of specific details and facts
+   - Presence of quotes or direct sources
+   - Balance and objectivity in reporting
+
+3. Verification Status:
+   - Is this a verified publisher?
+   - Are there clear author attributions?
+   - Is contact information available?
+   - Are sources cited properly?
+
+4. Technical Assessment:
+   - Website security (HTTPS)
+   - Professional formatting
+   - Presence of ads/sponsored content
+   - Mobile responsiveness
+
+Return the analysis as a JSON object in this exact format:
+{
+  "domain": "extracted domain name",
+  "score": 0-1 reliability score,
+  "verified": true/false,
+  "assessment": ["key findings"]
+}"""
+
+_ANALYSIS_SYSTEM = """Extract the funding announcement details from the news content provided by the user and verify the reported details against them.
+
+Please evaluate:
+1. Extracted Details:
+   - Full company name
+   - Exact funding amount in millions USD
+   - Round type/series
+   - Announcement date
+
+2. Verification:
+   - Are there any discrepancies between the reported and extracted information?
+   - For each discrepancy, assess its severity and potential impact on verification
+   - Consider the context and potential reasons for any differences
+   - Determine if the differences are significant enough to affect verification
+
+Return the analysis as a JSON object in this exact format:
+{
+  "extracted": {
+    "company_name": "full legal name",
+    "funding_amount": number in millions USD,
+    "round_type": "seed/series A/B/etc",
+    "announcement_date": "YYYY-MM-DD",
+    "source_url": "url"
+  },
+  "verification": {
+    "discrepancies": [
+      {"field": "field name", "reported_value": "value", "extracted_value": "value", "impact": 0-1 impact score}
+    ],
+    "verification_status": "VERIFIED" or "UNVERIFIED",
+    "confidence_score": 0-1,
+    "notes": "detailed explanation"
+  }
+}"""
+
+_REPORT_SYSTEM = """Generate a comprehensive verification report for the funding announcement provided by the user.
+
+Please provide:
+1. Executive Summary
+2. Detailed Analysis of Findings
+3. Risk Assessment
+4. Recommendations
+5. Confidence Level Explanation
+
+Format the report in a clear, professional style suitable for business stakeholders."""
+
+_NEWS_LINK_SYSTEM = """Find the most relevant news article about the funding described by the user.
+
+Return only the URL of the most reliable source found, or "None" if no reliable source is found."""
+
+def _html_to_text(html: str) -> str:
+    """Reduce an HTML page to its visible text."""
+    soup = BeautifulSoup(html, 'html.parser')
+    for tag in soup(['script', 'style', 'noscript']):
+        tag.decompose()
+    return soup.get_text(separator=' ', strip=True)
+
+def _csv_row(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten nested values of a dumped model into JSON strings for a CSV cell."""
+    return {
+        key: orjson.dumps(value).decode() if isinstance(value, (dict, list)) else value
+        for key, value in data.items()
+    }
+
+_AMOUNT_RX = re.compile(r'[-+]?\d*\.?\d+')
+
+_LEGAL_SUFFIX_RX = re.compile(r'[\s,]+(inc|corp|corporation|co|ltd|limited|llc|gmbh|sa|sas|plc|ag)\.?$', re.I)
+
+def _mentions_company(content: str, company_name: str) -> bool:
+    """Whether the page text mentions the company, ignoring case and a trailing legal suffix."""
+    name = _LEGAL_SUFFIX_RX.sub('', company_name.strip()).casefold()
+    return not name or name in content.casefold()
+
+def _reliability_prompt(url: str, content: str) -> str:
+    """User message asking for a news source's reliability."""
+    return f"URL: {url}\nContent Sample: {content[:1000]}..."
+
+def _announcement_prompt(reported: FundingAnnouncement, content: str) -> str:
+    """User message asking to extract and verify an announcement's details from its source."""
+    return f"""URL: {reported.news_link}
+
+REPORTED DETAILS:
+Company: {reported.company_name}
+Amount: ${reported.amount}M
+Round Type: {reported.round_type}
+Date: {reported.year}-{reported.month if reported.month else '01'}
+
+CONTENT:
+{content}"""
 
 class AIFundingVerifier:
-    def __init__(self, openai_api_key: str):
+    def __init__(
+        self,
+        openai_api_key: str,
+        max_rpm: float = 500,
+        max_tpm: float = 30000,
+        max_concurrent: int = 10
+    ):
         """Initialize the AI-powered funding verifier."""
-        self.client = AsyncOpenAI(api_key=openai_api_key)
+        # Process-wide client, shared pooled keep-alive connections to the API
+        self.client = get_client(openai_api_key)
         self.confidence_threshold = 0.8
         self.session = None
-        self.cache = {}  # Simple cache for URL contents
+        # LRU of URL -> content, including fetches still in flight
+        self.cache: "OrderedDict[str, asyncio.Future]" = OrderedDict()
+        self.cache_size = 512
         self.on_progress = None  # Callback for progress updates
         self.semaphore = asyncio.Semaphore(8)  # Increased to 8 concurrent API calls
+        self.http_semaphore = asyncio.Semaphore(20)  # Concurrent page fetches
+        self.max_concurrent = max_concurrent  # Announcements verified at once
+        self.embedding_model = "text-embedding-3-small"
+        self.dedup_threshold = 0.95  # Cosine similarity at which announcements count as duplicates
+        self.rate_limiter = TokenBucket(max_rpm, max_tpm)  # Refined from the rate-limit headers of each response
+        # Reliability is a property of the domain, so it is assessed once per domain
+        self._domain_reliability: Dict[str, Tuple[SourceReliability, float]] = {}
+        self._domain_locks: Dict[str, asyncio.Lock] = {}
+        self.reliability_ttl = 24 * 3600  # Seconds before a domain is reassessed
         self.checkpoint_file = "reports/checkpoint.json"
+        self.checkpoint_wal_file = "reports/checkpoint.wal"
+        self.snapshot_interval = 50  # Completions between full checkpoint snapshots
+        self.checkpoint_flush_size = 25  # Pending companies that trigger a WAL flush
+        self.checkpoint_flush_interval = 1.0  # Seconds between WAL flushes
         self.processed_companies = set()
+        self._wal = None  # Append-only log of companies processed since the last snapshot
+        self._completions_since_snapshot = 0
+        self._snapshot_task = None
+        self._pending_checkpoints: List[str] = []
+        self._last_flush = time.monotonic()
+        self._checkpoint_lock = asyncio.Lock()
+        # Results CSV stays open for the run; the status summary is written once on exit
+        self._results_fp = None
+        self._results_writer = None
+        self._status_totals: Dict[str, List[float]] = {}  # status -> [count, confidence sum]
         
     def load_checkpoint(self) -> None:
-        """Load the last checkpoint if it exists."""
+        """Load the last checkpoint snapshot and replay the write-ahead log on top of it."""
         try:
             if os.path.exists(self.checkpoint_file):
                 with open(self.checkpoint_file, 'r') as f:
                     checkpoint = json.load(f)
                     self.processed_companies = set(checkpoint.get('processed_companies', []))
-                    logging.info(f"Loaded checkpoint with {len(self.processed_companies)} processed companies")
+            if os.path.exists(self.checkpoint_wal_file):
+                with open(self.checkpoint_wal_file, 'r') as f:
+                    for line in f:
+                        company_name = line.rstrip('\n')
+                        if company_name:
+                            self.processed_companies.add(company_name)
+            if self.processed_companies:
+                logging.info(f"Loaded checkpoint with {len(self.processed_companies)} processed companies")
         except Exception as e:
             logging.error(f"Error loading checkpoint: {str(e)}")
             self.processed_companies = set()
 
-    def save_checkpoint(self) -> None:
-        """Save the current state to a checkpoint file."""
+    def _write_snapshot(self, companies: List[str]) -> None:
+        """Atomically write a full checkpoint snapshot to disk."""
+        checkpoint = {
+            'processed_companies': companies,
+            'timestamp': datetime.now().isoformat()
+        }
+        os.makedirs(os.path.dirname(self.checkpoint_file), exist_ok=True)
+        tmp_file = f"{self.checkpoint_file}.tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp_file, self.checkpoint_file)
+
+    async def save_checkpoint(self) -> None:
+        """Snapshot the processed companies and truncate the write-ahead log."""
+        companies = list(self.processed_companies)
         try:
-            checkpoint = {
-                'processed_companies': list(self.processed_companies),
-                'timestamp': datetime.now().isoformat()
-            }
-            os.makedirs(os.path.dirname(self.checkpoint_file), exist_ok=True)
-            with open(self.checkpoint_file, 'w') as f:
-                json.dump(checkpoint, f)
-            logging.info(f"Saved checkpoint with {len(self.processed_companies)} processed companies")
+            await asyncio.to_thread(self._write_snapshot, companies)
         except Exception as e:
             logging.error(f"Error saving checkpoint: {str(e)}")
+            return
+
+        if self._wal:
+            # Companies added while the snapshot was being written are not in it,
+            # so carry them over into the fresh log (pending ones get flushed later)
+            async with self._checkpoint_lock:
+                self._wal.close()
+                self._wal = open(self.checkpoint_wal_file, 'w')
+                carried = self.processed_companies.difference(companies, self._pending_checkpoints)
+                self._wal.writelines(f"{company_name}\n" for company_name in carried)
+                self._wal.flush()
+        logging.info(f"Saved checkpoint with {len(companies)} processed companies")
+
+    def _write_wal(self, lines: str) -> None:
+        """Append lines to the WAL and flush them to disk."""
+        self._wal.write(lines)
+        self._wal.flush()
+
+    async def _flush_checkpoint(self) -> None:
+        """Append all pending companies to the WAL in a single write."""
+        self._last_flush = time.monotonic()
+        if not self._pending_checkpoints:
+            return
+
+        lines = "".join(f"{company_name}\n" for company_name in self._pending_checkpoints)
+        self._pending_checkpoints = []
+        async with self._checkpoint_lock:
+            await asyncio.to_thread(self._write_wal, lines)
+
+    async def _record_processed(self, company_name: str) -> None:
+        """Queue a processed company for the WAL and schedule flushes and snapshots when due."""
+        self.processed_companies.add(company_name)
+        self._pending_checkpoints.append(company_name)
+        self._completions_since_snapshot += 1
+
+        if (len(self._pending_checkpoints) >= self.checkpoint_flush_size
+                or time.monotonic() - self._last_flush > self.checkpoint_flush_interval):
+            await self._flush_checkpoint()
+
+        snapshot_running = self._snapshot_task is not None and not self._snapshot_task.done()
+        if self._completions_since_snapshot >= self.snapshot_interval and not snapshot_running:
+            self._completions_since_snapshot = 0
+            self._snapshot_task = asyncio.create_task(self.save_checkpoint())
+
+    async def _close_checkpoint(self, remove: bool) -> None:
+        """Stop checkpointing, either removing the files or leaving a final snapshot."""
+        await self._flush_checkpoint()
+        if self._snapshot_task:
+            await self._snapshot_task
+            self._snapshot_task = None
+        if not remove:
+            await self.save_checkpoint()
+        self._wal.close()
+        self._wal = None
+        self._completions_since_snapshot = 0
+
+        if remove:
+            for path in (self.checkpoint_file, self.checkpoint_wal_file):
+                if os.path.exists(path):
+                    os.remove(path)
+            logging.info("Removed checkpoint files after successful completion")
 
     async def verify_batch(self, announcements: List[FundingAnnouncement], batch_size: int = 15) -> None:
-        """Process announcements in batches with improved error handling and parallel processing."""
+        """Verify announcements with bounded concurrency, saving results every batch_size completions."""
         # Load previous checkpoint
         self.load_checkpoint()
         
@@ -69,28 +329,33 @@ class AIFundingVerifier:
         
         results = []
         
-        # Filter out already processed companies
-        announcements_to_process = [
-            a for a in announcements 
-            if a.company_name not in self.processed_companies
-        ]
+        # Filter out already processed companies lazily, against the checkpoint as loaded
+        done = frozenset(self.processed_companies)
+        announcements_to_process = (a for a in announcements if a.company_name not in done)
+        remaining = sum(1 for a in announcements if a.company_name not in done)
         
-        logging.info(f"Resuming verification with {len(announcements_to_process)} remaining announcements")
+        logging.info(f"Resuming verification with {remaining} remaining announcements")
         
-        # Process announcements in larger batches
-        for i in range(0, len(announcements_to_process), batch_size):
-            batch = announcements_to_process[i:i + batch_size]
-            tasks = []
-            
-            for announcement in batch:
-                task = asyncio.create_task(self._process_single_announcement(announcement))
-                tasks.append(task)
-            
-            # Wait for all tasks in the batch to complete
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
+        os.makedirs(os.path.dirname(self.checkpoint_wal_file), exist_ok=True)
+        self._wal = open(self.checkpoint_wal_file, 'a')
+        self._last_flush = time.monotonic()
+        
+        # Verify one announcement per group of near-duplicates, keeping max_concurrent in flight
+        async for group, head_result in run_parallel(
+            self._duplicate_groups(announcements_to_process, batch_size),
+            lambda group: self._process_single_announcement(group[0]),
+            self.max_concurrent
+        ):
+            # Duplicates share their group head's outcome
+            group_results = [head_result]
+            for duplicate in group[1:]:
+                if head_result and not isinstance(head_result, Exception):
+                    group_results.append(self._duplicate_result(head_result, duplicate))
+                else:
+                    group_results.append(head_result)
             
             # Process results
-            for result in batch_results:
+            for result in group_results:
                 if isinstance(result, Exception):
                     errors += 1
                     logging.error(f"Error processing announcement: {str(result)}")
@@ -99,23 +364,22 @@ class AIFundingVerifier:
                 if result:
                     verified += 1
                     results.append(result)
-                    self.processed_companies.add(result.company_name)
+                    await self._record_processed(result.company_name)
                 
                 processed += 1
                 if self.on_progress:
                     await self.on_progress()
-                
-                # Save checkpoint after each successful verification
-                self.save_checkpoint()
-                
-                # Reduced delay between batches
-                await asyncio.sleep(0.3)
             
-            # Save batch results more frequently
-            if results:
+            if len(results) >= batch_size:
+                # Flush the batch's processed companies to the WAL in one write
+                await self._flush_checkpoint()
                 await self._save_results(results)
                 results = []  # Clear results after saving
         
+        await self._flush_checkpoint()
+        if results:
+            await self._save_results(results)
+        
         # Save final summary
         summary = {
             "total_processed": total,
@@ -125,19 +389,112 @@ class AIFundingVerifier:
         }
         await self._save_summary(summary)
         
-        # Clean up checkpoint file after successful completion
-        if os.path.exists(self.checkpoint_file):
-            os.remove(self.checkpoint_file)
-            logging.info("Removed checkpoint file after successful completion")
+        # Clean up checkpoint files after successful completion
+        await self._close_checkpoint(remove=True)
+
+    async def _process_single_announcement(self, announcement: FundingAnnouncement) -> Optional[VerificationResult]:
+        """Verify one announcement, returning None when it has no news link to check."""
+        if not announcement.news_link:
+            return None
+        return await self.verify_announcement(announcement)
+
+    async def _duplicate_groups(
+        self,
+        announcements: Iterable[FundingAnnouncement],
+        batch_size: int
+    ) -> AsyncIterator[List[FundingAnnouncement]]:
+        """Yield groups of near-duplicate announcements, grouping batch_size announcements at a time."""
+        announcements = iter(announcements)
+        while batch := list(islice(announcements, batch_size)):
+            for group in await self._group_duplicates(batch):
+                yield group
+
+    async def _group_duplicates(self, batch: List[FundingAnnouncement]) -> List[List[FundingAnnouncement]]:
+        """Group announcements of the same round reported by several outlets, head first.
+
+        Announcements with a news link are embedded in one call and grouped greedily
+        when their cosine similarity reaches dedup_threshold and amount and round type
+        match exactly. Announcements without a link can't head or join a group, so
+        they stay on their own.
+        """
+        linkless = [[announcement] for announcement in batch if not announcement.news_link]
+        batch = [announcement for announcement in batch if announcement.news_link]
+        if len(batch) < 2:
+            return [[announcement] for announcement in batch] + linkless
+
+        try:
+            async with self.semaphore:
+                response = await self.client.embeddings.create(
+                    model=self.embedding_model,
+                    input=[f"{a.company_name} {a.amount} {a.round_type}" for a in batch]
+                )
+            vectors = np.array([item.embedding for item in response.data], dtype=np.float32)
+            vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        except Exception as e:
+            logging.warning(f"Error embedding announcements for deduplication: {str(e)}")
+            return [[announcement] for announcement in batch] + linkless
+
+        heads: List[int] = []
+        groups: List[List[FundingAnnouncement]] = []
+        for i, announcement in enumerate(batch):
+            key = (announcement.amount, announcement.round_type.casefold())
+            for head, group in zip(heads, groups):
+                if (key == (batch[head].amount, batch[head].round_type.casefold())
+                        and vectors[i] @ vectors[head] >= self.dedup_threshold):
+                    group.append(announcement)
+                    break
+            else:
+                heads.append(i)
+                groups.append([announcement])
+
+        if len(groups) < len(batch):
+            logging.info(f"Verifying {len(groups)} of {len(batch)} linked announcements after deduplication")
+        return groups + linkless
+
+    def _duplicate_result(self, result: VerificationResult, duplicate: FundingAnnouncement) -> VerificationResult:
+        """Copy a group head's verification result onto one of its duplicates.
+
+        The duplicate keeps its own news link. The head's source reliability is only
+        reused for the same domain; otherwise the duplicate's domain comes from the
+        reliability cache, or is left unassessed.
+        """
+        source_reliability = result.source_reliability
+        if urlparse(duplicate.news_link).netloc.lower() != urlparse(result.news_link or '').netloc.lower():
+            source_reliability = self._cached_reliability(urlparse(duplicate.news_link).netloc.lower())
+        return result.model_copy(update={
+            'company_name': duplicate.company_name,
+            'news_link': duplicate.news_link,
+            'source_reliability': source_reliability,
+            'verification_notes': f"{result.verification_notes} (shared with duplicate announcement of {result.company_name} from {result.news_link})"
+        })
 
     async def __aenter__(self):
-        timeout = aiohttp.ClientTimeout(total=20)  # Reduced timeout to 20 seconds
-        self.session = aiohttp.ClientSession(timeout=timeout)
+        # One pooled, keep-alive client for the verifier's lifetime so repeat hosts
+        # (most funding news comes from a handful of outlets) skip TCP/TLS setup, and
+        # with HTTP/2 share a single multiplexed connection per origin.
+        # Browser UA on every request, so a 403 is a real refusal that retries can handle
+        self.session = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=60),
+            timeout=httpx.Timeout(15.0, connect=5.0),
+            headers=UA_HEADERS,
+            verify=False,
+            follow_redirects=True
+        )
+        self._open_results_writer()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._wal:
+            # Interrupted mid-run: leave a full snapshot to resume from
+            await self._close_checkpoint(remove=False)
+        if self._results_fp:
+            await asyncio.to_thread(self._save_status_summary)
+            self._results_fp.close()
+            self._results_fp = None
         if self.session:
-            await self.session.close()
+            await self.session.aclose()
+        # The shared OpenAI client is closed at process exit, see clients.close_clients
         
     async def verify_announcement(self, reported: FundingAnnouncement) -> VerificationResult:
         """Verify a single funding announcement."""
@@ -148,163 +505,115 @@ class AIFundingVerifier:
             except Exception as e:
                 logging.error(f"Error fetching content from {reported.news_link}: {str(e)}")
                 # Return unverified result if content cannot be fetched
-                return VerificationResult(
-                    company_name=reported.company_name,
-                    verification_status=VerificationStatus.UNVERIFIED,
-                    overall_confidence=0.0,
-                    source_url=reported.news_link,
-                    discrepancies=[],
-                    verification_notes=f"Could not verify - Failed to fetch content: {str(e)}"
-                )
+                return self._unverified_result(reported, f"Could not verify - Failed to fetch content: {str(e)}")
             
-            # Analyze source reliability
-            source_reliability = await self._analyze_source_reliability(reported.news_link, content)
+            # An article that never names the company can't verify it, skip the LLM calls
+            if not _mentions_company(content, reported.company_name):
+                return self._unverified_result(reported, "Could not verify - company name not found in source page")
             
-            # Extract details from content
-            extracted = await self._extract_announcement_details(content)
+            # Source reliability and the extraction/verification call only need the
+            # content, so their round-trips overlap
+            source_reliability, analysis = await asyncio.gather(
+                self._analyze_source_reliability(reported.news_link, content),
+                self._analyze_announcement(reported, content)
+            )
             
-            # Verify the announcement
-            result = await self._verify_details(reported, extracted, source_reliability)
+            extracted = self._parse_announcement_details(analysis.get('extracted') or {})
+            logging.debug(f"Extracted details for {reported.company_name}: {extracted}")
             
-            return result
+            return self._parse_verification(reported, analysis.get('verification') or {}, source_reliability)
             
         except Exception as e:
             logging.error(f"Error verifying announcement: {str(e)}")
             raise
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
-    async def _analyze_source_reliability(self, url: str, content: str) -> SourceReliability:
-        """Analyze the reliability of a news source."""
-        prompt = f"""Perform a comprehensive analysis of this news source:
-
-URL: {url}
-Content Sample: {content[:1000]}...
-
-Please evaluate:
-1. Domain Reputation:
-   - Is this a well-known financial/business news source?
-   - Check for professional domain and established presence
-   - Assess editorial standards and fact-checking practices
-
-2. Content Quality:
-   - Writing professionalism and clarity
-   - Use of specific details and facts
-   - Presence of quotes or direct sources
-   - Balance and objectivity in reporting
+    def _unverified_result(self, reported: FundingAnnouncement, notes: str) -> VerificationResult:
+        """Result for an announcement that could not be checked against its source."""
+        return VerificationResult(
+            company_name=reported.company_name,
+            verification_status=VerificationStatus.UNVERIFIED,
+            overall_confidence=0.0,
+            news_link=reported.news_link,
+            source_reliability=None,
+            discrepancies=[],
+            verification_notes=notes
+        )
 
-3. Verification Status:
-   - Is this a verified publisher?
-   - Are there clear author attributions?
-   - Is contact information available?
-   - Are sources cited properly?
+    def _cached_reliability(self, domain: str) -> Optional[SourceReliability]:
+        """Return the domain's cached reliability unless it has expired."""
+        cached = self._domain_reliability.get(domain)
+        if cached and time.monotonic() - cached[1] < self.reliability_ttl:
+            return cached[0]
+        return None
 
-4. Technical Assessment:
-   - Website security (HTTPS)
-   - Professional formatting
-   - Presence of ads/sponsored content
-   - Mobile responsiveness
+    async def _analyze_source_reliability(self, url: str, content: str) -> SourceReliability:
+        """Analyze the reliability of a news source, once per domain."""
+        domain = urlparse(url).netloc.lower()
+        cached = self._cached_reliability(domain)
+        if cached:
+            return cached
+
+        async with self._domain_locks.setdefault(domain, asyncio.Lock()):
+            # Another task may have assessed the domain while we waited for the lock
+            cached = self._cached_reliability(domain)
+            if cached:
+                return cached
 
-Return the analysis in this format:
-Domain: [extracted domain name]
-Score: [0-1 reliability score]
-Verified: [yes/no]
-Detailed Assessment:
-[bullet points with key findings]"""
+            try:
+                source_reliability = await self._assess_source_reliability(url, content)
+            except Exception as e:
+                logging.warning(f"Error analyzing source reliability for {url}: {str(e)}")
+                # Default moderate score, not cached so the domain is assessed again
+                return self._parse_source_reliability(url, {})
+
+            self._domain_reliability[domain] = (source_reliability, time.monotonic())
+            return source_reliability
+
+    @retry(stop=stop_after_attempt(3), wait=wait_retry_after)
+    async def _assess_source_reliability(self, url: str, content: str) -> SourceReliability:
+        """Ask the model to assess a news source from its URL and a content sample."""
+        response = await self._chat_completion(
+            _RELIABILITY_SYSTEM,
+            _reliability_prompt(url, content),
+            response_format={"type": "json_object"}
+        )
+        return self._parse_source_reliability(url, orjson.loads(response))
+
+    @retry(stop=stop_after_attempt(3), wait=wait_retry_after)
+    async def _analyze_announcement(self, reported: FundingAnnouncement, content: str) -> Dict[str, Any]:
+        """Extract details from the content and verify them against the reported details in one call."""
+        response = await self._chat_completion(
+            _ANALYSIS_SYSTEM,
+            _announcement_prompt(reported, content),
+            response_format={"type": "json_object"},
+            max_tokens=1000
+        )
+        return orjson.loads(response)
 
+    def _parse_source_reliability(self, url: str, data: Dict[str, Any]) -> SourceReliability:
+        """Build the source reliability from the analysis, defaulting to a moderate score."""
+        domain = url.split('/')[2]
         try:
-            response = await self._chat_completion(prompt)
-            
-            # Parse response
-            lines = response.split('\n')
-            domain = url.split('/')[2]
-            score = 0.5  # Default score
-            is_verified = False
-            
-            for line in lines:
-                line = line.strip()
-                if line.startswith('Score:'):
-                    try:
-                        score = float(line.split(':')[1].strip())
-                    except ValueError:
-                        pass
-                elif line.startswith('Verified:'):
-                    is_verified = 'yes' in line.lower()
-                elif line.startswith('Domain:'):
-                    domain = line.split(':')[1].strip() or domain
-            
-            return SourceReliability(
-                domain=domain,
-                score=score,
-                verification_status=VerificationStatus.VERIFIED if is_verified else VerificationStatus.UNVERIFIED
-            )
-        except Exception as e:
-            logging.warning(f"Error analyzing source reliability for {url}: {str(e)}")
-            return SourceReliability(
-                domain=url.split('/')[2],
-                score=0.5,  # Default moderate score
-                verification_status=VerificationStatus.UNVERIFIED
-            )
-
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
-    async def _extract_announcement_details(self, content: str) -> FundingAnnouncement:
-        """Extract funding announcement details from content."""
-        prompt = f"""Extract detailed funding announcement information from this content:
-{content}
-
-Please analyze the text carefully and extract:
-
-1. Company Information:
-   - Full company name
-   - Any alternative names or trading names mentioned
-   - Brief description of company's business
-
-2. Funding Details:
-   - Exact funding amount in millions USD
-   - Round type/series
-   - Pre/post-money valuation if mentioned
-   - Previous funding rounds if mentioned
-
-3. Timing Information:
-   - Announcement date
-   - Closing date if different
-   - Any relevant timeline details
-
-4. Additional Context:
-   - Key investors involved
-   - Use of funds
-   - Company growth metrics
-   - Market context
-
-Return the core announcement details in this exact format:
-Company name: [full legal name]
-Funding amount: [number in millions USD]
-Round type: [seed/series A/B/etc]
-Announcement date: [YYYY-MM-DD]
-Source URL: [url]
-
-Additional context:
-[bullet points with other relevant details]"""
-
-        response = await self._chat_completion(prompt)
-        
-        # Parse response and create FundingAnnouncement object
-        lines = response.split('\n')
-        details = {}
-        
-        # Extract core details
-        for line in lines:
-            if ':' in line and not line.startswith('Additional context'):
-                key, value = line.split(':', 1)
-                details[key.strip().lower().replace(' ', '_')] = value.strip()
+            score = float(data.get('score', 0.5))
+        except (TypeError, ValueError):
+            score = 0.5  # Default moderate score
+        is_verified = str(data.get('verified', '')).lower() in ('true', 'yes')
         
+        return SourceReliability(
+            domain=data.get('domain') or domain,
+            score=score,
+            verification_status=VerificationStatus.VERIFIED if is_verified else VerificationStatus.UNVERIFIED
+        )
+
+    def _parse_announcement_details(self, details: Dict[str, Any]) -> FundingDetails:
+        """Build the funding details extracted from the source content."""
         try:
-            # Clean and convert amount
-            amount_str = details.get('funding_amount', '0')
-            amount_str = amount_str.replace('$', '').replace(',', '').replace('M', '').replace('USD', '').strip()
-            amount = float(amount_str)
+            # Take the first number of the amount, ignoring currency and unit text
+            amount_match = _AMOUNT_RX.search(str(details.get('funding_amount', '0')).replace(',', ''))
+            amount = float(amount_match.group()) if amount_match else 0.0
             
             # Clean and standardize round type
-            round_type = details.get('round_type', '').strip().upper()
+            round_type = str(details.get('round_type') or '').strip().upper()
             if 'SERIES' not in round_type and round_type not in ['SEED', 'ANGEL', 'IPO']:
                 if round_type:
                     round_type = f"SERIES {round_type}"
@@ -312,118 +621,72 @@ Additional context:
                     round_type = "UNSPECIFIED"
             
             # Parse and validate date
-            date_str = details.get('announcement_date', '')
+            date_str = str(details.get('announcement_date') or '')
             try:
-                announcement_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+                announcement_date = date.fromisoformat(date_str)
             except ValueError:
-                announcement_date = datetime.now().date()
+                announcement_date = date.today()
             
-            return FundingAnnouncement(
-                company_name=details.get('company_name', ''),
+            return FundingDetails(
+                company_name=details.get('company_name') or '',
                 amount=amount,
                 round_type=round_type,
                 date=announcement_date,
-                source_url=details.get('source_url', '')
+                source_url=details.get('source_url') or ''
             )
             
         except (KeyError, ValueError) as e:
             logging.warning(f"Error parsing extracted details: {str(e)}")
             # Return a minimal announcement with default values
-            return FundingAnnouncement(
-                company_name=details.get('company_name', ''),
+            return FundingDetails(
+                company_name=details.get('company_name') or '',
                 amount=0.0,
                 round_type="UNSPECIFIED",
-                date=datetime.now().date(),
-                source_url=details.get('source_url', '')
+                date=date.today(),
+                source_url=details.get('source_url') or ''
             )
 
-    async def _verify_details(
+    def _parse_verification(
         self,
         reported: FundingAnnouncement,
-        extracted: FundingAnnouncement,
+        data: Dict[str, Any],
         source_reliability: SourceReliability
     ) -> VerificationResult:
-        """Compare reported and extracted details to verify the announcement."""
-        comparison_prompt = f"""Analyze and compare these funding announcement details:
-
-REPORTED DETAILS:
-Company: {reported.company_name}
-Amount: ${reported.amount}M
-Round Type: {reported.round_type}
-Date: {reported.year}-{reported.month if reported.month else '01'}
-
-EXTRACTED DETAILS:
-Company: {extracted.company_name}
-Amount: ${extracted.amount}M
-Round Type: {extracted.round_type}
-Date: {extracted.date}
-
-Please analyze:
-1. Are there any discrepancies between the reported and extracted information?
-2. For each discrepancy, assess its severity and potential impact on verification
-3. Consider the context and potential reasons for any differences
-4. Determine if the differences are significant enough to affect verification
-
-Return the analysis in this format:
-Discrepancies: [list each discrepancy with field, values, and impact score 0-1]
-Verification Status: [VERIFIED/UNVERIFIED]
-Confidence Score: [0-1]
-Notes: [detailed explanation]"""
-
-        # Get AI analysis
-        analysis = await self._chat_completion(comparison_prompt)
+        """Build the verification result from the analysis of reported vs extracted details."""
+        status = (
+            VerificationStatus.VERIFIED
+            if str(data.get('verification_status', '')).strip().upper() == "VERIFIED"
+            else VerificationStatus.UNVERIFIED
+        )
+        try:
+            confidence = float(data.get('confidence_score', 0.5))
+        except (TypeError, ValueError):
+            confidence = 0.5
         
-        # Parse AI response and create discrepancies
         discrepancies = []
-        verification_notes = []
-        
-        # Extract discrepancies from AI response
-        response_lines = analysis.split('\n')
-        current_section = ""
-        
-        for line in response_lines:
-            line = line.strip()
-            if line.startswith('Discrepancies:'):
-                current_section = "discrepancies"
-            elif line.startswith('Verification Status:'):
-                status_line = line.split(':')[1].strip()
-                status = VerificationStatus.VERIFIED if "VERIFIED" in status_line else VerificationStatus.UNVERIFIED
-            elif line.startswith('Confidence Score:'):
-                try:
-                    confidence = float(line.split(':')[1].strip())
-                except ValueError:
-                    confidence = 0.5
-            elif line.startswith('Notes:'):
-                current_section = "notes"
-            elif line and current_section == "discrepancies" and ':' in line:
-                # Parse discrepancy line
-                field = line.split(':')[0].strip()
-                values = line.split(':')[1].strip()
-                if 'impact' in values.lower():
-                    try:
-                        impact = float(values.split('impact')[1].strip().split()[0])
-                    except (ValueError, IndexError):
-                        impact = 0.2
-                    reported_val = values.split('vs')[0].strip()
-                    extracted_val = values.split('vs')[1].split('impact')[0].strip()
-                    
-                    discrepancies.append(Discrepancy(
-                        field=field,
-                        reported_value=reported_val,
-                        extracted_value=extracted_val,
-                        impact=impact
-                    ))
-            elif line and current_section == "notes":
-                verification_notes.append(line)
+        for item in data.get('discrepancies') or []:
+            if not isinstance(item, dict):
+                continue
+            try:
+                impact = float(item.get('impact', 0.2))
+            except (TypeError, ValueError):
+                impact = 0.2
+            discrepancies.append(Discrepancy(
+                field=str(item.get('field', '')),
+                reported_value=str(item.get('reported_value', '')),
+                extracted_value=str(item.get('extracted_value', '')),
+                impact=impact
+            ))
         
         # Create verification result
         result = VerificationResult(
             company_name=reported.company_name,
             verification_status=status,
             overall_confidence=confidence * source_reliability.score,  # Adjust confidence based on source reliability
-            source_url=reported.news_link,
+            news_link=reported.news_link,
+            source_reliability=source_reliability,
             discrepancies=discrepancies,
-            verification_notes="\n".join(verification_notes) if verification_notes else "No detailed notes provided."
+            verification_notes=data.get('notes') or "No detailed notes provided."
         )
         
         return result
@@ -433,79 +696,82 @@ Notes: [detailed explanation]"""
         if not discrepancies:
             return "All details verified successfully. No discrepancies found."
         
-        notes = ["Verification completed with the following discrepancies:"]
-        for d in discrepancies:
-            notes.append(f"- {str(d)}")
-        
-        return "\n".join(notes)
+        details = "\n".join([f"- {d}" for d in discrepancies])
+        return f"Verification completed with the following discrepancies:\n{details}"
             
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
+    @retry(stop=stop_after_attempt(3), wait=wait_retry_after)
     async def _fetch_content(self, url: str) -> str:
-        """Fetch content from URL with retry logic."""
+        """Fetch content from URL with retry logic, sharing in-flight fetches of the same URL."""
         if url in self.cache:
-            return self.cache[url]
-
-        if not self.session:
-            timeout = aiohttp.ClientTimeout(total=30)
-            self.session = aiohttp.ClientSession(timeout=timeout)
-
+            self.cache.move_to_end(url)
+            # Shielded so one cancelled waiter doesn't cancel the fetch for the others
+            return await asyncio.shield(self.cache[url])
+
+        future = asyncio.get_running_loop().create_future()
+        self.cache[url] = future
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
         try:
-            async with self.session.get(url, ssl=False, allow_redirects=True) as response:
-                if response.status == 403:
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                    }
-                    async with self.session.get(url, headers=headers, ssl=False) as response:
-                        if response.status != 200:
-                            raise aiohttp.ClientError(f"HTTP {response.status}: {response.reason}")
-                        content = await response.text()
-                elif response.status != 200:
-                    raise aiohttp.ClientError(f"HTTP {response.status}: {response.reason}")
-                else:
-                    content = await response.text()
+            content = await self._get(url)
 
-            self.cache[url] = content
+            # Parsing is CPU-bound, keep it off the event loop
+            content = await asyncio.to_thread(_html_to_text, content)
+            content = content[:MAX_CONTENT_LENGTH]
+            future.set_result(content)
             return content
+        except asyncio.CancelledError:
+            self._discard_cached(url, future)
+            future.cancel()
+            raise
         except Exception as e:
+            # Drop failed fetches so a retry refetches instead of reusing the error
+            self._discard_cached(url, future)
+            future.set_exception(e)
+            future.exception()  # Mark retrieved: waiters are optional
             logging.error(f"Error fetching content from {url}: {str(e)}")
             raise
 
+    def _discard_cached(self, url: str, future: asyncio.Future) -> None:
+        """Remove a cache entry unless it was already evicted and replaced."""
+        if self.cache.get(url) is future:
+            del self.cache[url]
+
+    async def _get(self, url: str) -> str:
+        """GET a URL on the shared session and return its body, raising HTTPStatusError unless HTTP 200.
+
+        The body is streamed and cut off after MAX_DOWNLOAD_BYTES, so heavy pages
+        are never buffered in full.
+        """
+        async with self.http_semaphore:
+            async with self.session.stream('GET', url) as response:
+                if response.status_code != 200:
+                    # Carries the response headers so retries can honour Retry-After
+                    raise httpx.HTTPStatusError(
+                        f"HTTP {response.status_code}: {response.reason_phrase}",
+                        request=response.request,
+                        response=response
+                    )
+
+                chunks, total = [], 0
+                async for chunk in response.aiter_bytes(8192):
+                    chunks.append(chunk)
+                    total += len(chunk)
+                    if total >= MAX_DOWNLOAD_BYTES:
+                        break
+                content = b"".join(chunks).decode(response.charset_encoding or "utf-8", errors="replace")
+                return content
+
     def _save_batch_results(self, results: List[Dict[str, Any]]) -> None:
         """Save batch verification results to CSV files."""
         try:
-            # Convert results to DataFrame
-            df = pd.DataFrame(results)
-            
-            # Save detailed results
-            df.to_csv(
-                'reports/verification_results.csv',
-                mode='a',
-                header=not os.path.exists('reports/verification_results.csv'),
-                index=False
-            )
-            
-            # Save summary
-            summary = df.groupby('verification_status').agg({
-                'company_name': 'count',
-                'overall_confidence': 'mean'
-            }).round(2)
-            
-            summary.to_csv(
-                'reports/verification_summary.csv',
-                mode='a',
-                header=not os.path.exists('reports/verification_summary.csv'),
-                index=True
-            )
-            
+            self._write_result_rows(results)
         except Exception as e:
             logging.error(f"Error saving batch results: {str(e)}")
             raise
 
     async def generate_detailed_report(self, result: VerificationResult, source_reliability: SourceReliability) -> str:
         """Generate a detailed verification report."""
-        prompt = f"""Generate a comprehensive verification report for this funding announcement:
-
-Company: {result.company_name}
+        user_content = f"""Company: {result.company_name}
 Status: {result.verification_status}
 Confidence: {result.overall_confidence:.2f}
 
@@ -515,19 +781,10 @@ Source Assessment:
 - Verified Publisher: {"Yes" if source_reliability.verification_status == VerificationStatus.VERIFIED else "No"}
 
 Discrepancies Found: {len(result.discrepancies)}
-{self._format_discrepancies_for_prompt(result.discrepancies)}
-
-Please provide:
-1. Executive Summary
-2. Detailed Analysis of Findings
-3. Risk Assessment
-4. Recommendations
-5. Confidence Level Explanation
-
-Format the report in a clear, professional style suitable for business stakeholders."""
+{self._format_discrepancies_for_prompt(result.discrepancies)}"""
 
         try:
-            response = await self._chat_completion(prompt)
+            response = await self._chat_completion(_REPORT_SYSTEM, user_content)
             return response
         except Exception as e:
             logging.error(f"Error generating detailed report: {str(e)}")
@@ -538,13 +795,11 @@ Format the report in a clear, professional style suitable for business stakehold
         if not discrepancies:
             return "No discrepancies found."
         
-        formatted = ["Discrepancy Details:"]
-        for d in discrepancies:
-            formatted.append(f"- {d.field}:")
-            formatted.append(f"  Reported: {d.reported_value}")
-            formatted.append(f"  Extracted: {d.extracted_value}")
-            formatted.append(f"  Impact Score: {d.impact:.2f}")
-        return "\n".join(formatted)
+        details = "\n".join([
+            f"- {d.field}:\n  Reported: {d.reported_value}\n  Extracted: {d.extracted_value}\n  Impact Score: {d.impact:.2f}"
+            for d in discrepancies
+        ])
+        return f"Discrepancy Details:\n{details}"
 
     def _generate_fallback_report(self, result: VerificationResult, source_reliability: SourceReliability) -> str:
         """Generate a basic report when AI generation fails."""
@@ -580,12 +835,10 @@ Report generated on: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}"""
         
         try:
             # Use the API to find relevant articles
-            response = await self._chat_completion(f"""Find the most relevant news article about this funding:
-            Company: {company_name}
-            Funding Info: {funding_info}
-            
-            Return only the URL of the most reliable source found, or "None" if no reliable source is found.
-            """)
+            response = await self._chat_completion(
+                _NEWS_LINK_SYSTEM,
+                f"Company: {company_name}\nFunding Info: {funding_info}"
+            )
             
             url = response.strip()
             if url.lower() == "none" or not url.startswith("http"):
@@ -607,62 +860,89 @@ Report generated on: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}"""
     async def _save_results(self, results: List[VerificationResult]) -> None:
         """Save verification results to CSV files."""
         try:
-            # Convert results to DataFrame
-            df = pd.DataFrame([result.__dict__ for result in results])
-            
-            # Save detailed results
-            df.to_csv(
-                'reports/verification_results.csv',
-                mode='a',
-                header=not os.path.exists('reports/verification_results.csv'),
-                index=False
-            )
-            
-            # Save summary
-            summary = df.groupby('verification_status').agg({
-                'company_name': 'count',
-                'overall_confidence': 'mean'
-            }).round(2)
-            
-            summary.to_csv(
-                'reports/verification_summary.csv',
-                mode='a',
-                header=not os.path.exists('reports/verification_summary.csv'),
-                index=True
-            )
-            
+            rows = [_csv_row(data) for data in VerificationResult.dump_batch(results)]
+            await asyncio.to_thread(self._write_result_rows, rows)
         except Exception as e:
             logging.error(f"Error saving results: {str(e)}")
             raise
 
+    def _open_results_writer(self) -> None:
+        """Open the results CSV for appending, writing the header if the file is new."""
+        os.makedirs(os.path.dirname(RESULTS_FILE), exist_ok=True)
+        self._results_fp = open(RESULTS_FILE, 'a', newline='')
+        self._results_writer = csv.DictWriter(self._results_fp, fieldnames=RESULTS_FIELDS, extrasaction='ignore')
+        if self._results_fp.tell() == 0:
+            self._results_writer.writeheader()
+
+    def _write_result_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """Append result rows to the open results CSV and tally them per status."""
+        self._results_writer.writerows(rows)
+        self._results_fp.flush()
+        for row in rows:
+            status = row.get('verification_status')
+            totals = self._status_totals.setdefault(getattr(status, 'value', str(status)), [0, 0.0])
+            totals[0] += 1
+            totals[1] += row.get('overall_confidence') or 0.0
+
+    def _save_status_summary(self) -> None:
+        """Append the per-status count and mean confidence of this run to the summary CSV."""
+        if not self._status_totals:
+            return
+        try:
+            rows = [
+                {
+                    'verification_status': status,
+                    'company_name': count,
+                    'overall_confidence': round(confidence / count, 2)
+                }
+                for status, (count, confidence) in sorted(self._status_totals.items())
+            ]
+            self._append_summary_rows(rows)
+        except Exception as e:
+            logging.error(f"Error saving status summary: {str(e)}")
+
+    def _append_summary_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """Append rows to the summary CSV, writing a header if the file is new."""
+        with open(SUMMARY_FILE, 'a', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            if f.tell() == 0:
+                writer.writeheader()
+            writer.writerows(rows)
+
     async def _save_summary(self, summary: Dict[str, int]) -> None:
         """Save verification summary to CSV file."""
         try:
-            # Convert summary to DataFrame
-            df = pd.DataFrame([summary])
-            
-            # Save summary
-            df.to_csv(
-                'reports/verification_summary.csv',
-                mode='a',
-                header=not os.path.exists('reports/verification_summary.csv'),
-                index=False
-            )
-            
+            await asyncio.to_thread(self._append_summary_rows, [summary])
         except Exception as e:
             logging.error(f"Error saving summary: {str(e)}")
             raise
 
-    @retry(stop=stop_after_attempt(2), wait=wait_exponential(multiplier=1, min=2, max=5))
-    async def _chat_completion(self, prompt: str) -> str:
+    @retry(stop=stop_after_attempt(2), wait=wait_retry_after)
+    async def _chat_completion(
+        self,
+        system_prompt: str,
+        user_content: str,
+        response_format: Optional[Dict[str, str]] = None,
+        max_tokens: int = 500  # Reduced max tokens for faster responses
+    ) -> str:
         """Make an API call with reduced retry attempts and wait times."""
+        extra_params = {"response_format": response_format} if response_format else {}
         try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4-turbo-preview",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.3,  # Reduced temperature for faster, more consistent responses
-                max_tokens=500  # Reduced max tokens for faster responses
-            )
+            async with self.semaphore:
+                # Rough estimate of ~4 characters per token, plus the completion budget
+                await self.rate_limiter.acquire((len(system_prompt) + len(user_content)) // 4 + max_tokens)
+                raw_response = await self.client.chat.completions.with_raw_response.create(
+                    model="gpt-4-turbo-preview",
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_content}
+                    ],
+                    temperature=0.3,  # Reduced temperature for faster, more consistent responses
+                    max_tokens=max_tokens,
+                    **extra_params
+                )
+            self.rate_limiter.update_from_headers(raw_response.headers)
+            response = raw_response.parse()
             return response.choices[0].message.content
         except Exception as e:
             logging.error(f"Error in chat completion: {str(e)}")
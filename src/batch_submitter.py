@@ -0,0 +1,191 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import orjson
+
+from .ai_verifier import (
+    AIFundingVerifier,
+    _ANALYSIS_SYSTEM,
+    _RELIABILITY_SYSTEM,
+    _announcement_prompt,
+    _mentions_company,
+    _reliability_prompt,
+)
+from .parallel import run_parallel
+from .pydantic_models import FundingAnnouncement, SourceReliability, VerificationResult
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_MODEL = "gpt-4o-mini"
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+class BatchSubmitter:
+    """Verify announcements offline through the OpenAI Batch API.
+
+    Source pages are fetched as in a live run, then every announcement analysis
+    and one reliability assessment per domain go into a single batch job. Batch
+    jobs run server-side within 24h at half the price and outside the
+    synchronous rate limits, which suits the nightly run over the whole CSV.
+    """
+
+    def __init__(self, verifier: AIFundingVerifier, model: str = BATCH_MODEL, poll_interval: float = 60.0):
+        self.verifier = verifier
+        self.model = model
+        self.poll_interval = poll_interval
+
+    async def run(self, announcements: List[FundingAnnouncement]) -> None:
+        """Verify the announcements in one batch job and save results like verify_batch."""
+        fetched, results = await self._fetch_sources(announcements)
+        analysed = []
+        if fetched:
+            replies = await self._run_batch(self._build_requests(fetched))
+            analysed = self._build_results(fetched, replies)
+        results.extend(analysed)
+
+        await self.verifier._save_results(results)
+        await self.verifier._save_summary({
+            "total_processed": len(announcements),
+            "with_links": sum(1 for a in announcements if a.news_link),
+            "verified": len(results),
+            # Announcements whose batch request failed or returned no usable reply
+            "errors": len(fetched) - len(analysed)
+        })
+
+    async def _fetch_sources(
+        self, announcements: List[FundingAnnouncement]
+    ) -> Tuple[List[Tuple[FundingAnnouncement, str]], List[VerificationResult]]:
+        """Fetch every source page, returning the ones worth analysing and results for the rest."""
+        fetched = []
+        results = []
+        async for reported, content in run_parallel(
+            (a for a in announcements if a.news_link),
+            lambda a: self.verifier._fetch_content(a.news_link),
+            self.verifier.max_concurrent
+        ):
+            if isinstance(content, Exception):
+                logging.error(f"Error fetching content from {reported.news_link}: {str(content)}")
+                results.append(self.verifier._unverified_result(
+                    reported, f"Could not verify - Failed to fetch content: {str(content)}"
+                ))
+            elif not _mentions_company(content, reported.company_name):
+                results.append(self.verifier._unverified_result(
+                    reported, "Could not verify - company name not found in source page"
+                ))
+            else:
+                fetched.append((reported, content))
+        return fetched, results
+
+    def _build_requests(self, fetched: List[Tuple[FundingAnnouncement, str]]) -> List[Dict[str, Any]]:
+        """One analysis request per announcement and one reliability request per uncached domain."""
+        requests = []
+        domains = set()
+        for index, (reported, content) in enumerate(fetched):
+            requests.append(self._request(
+                f"analysis-{index}", _ANALYSIS_SYSTEM, _announcement_prompt(reported, content), 1000
+            ))
+
+            domain = urlparse(reported.news_link).netloc.lower()
+            if domain in domains or self.verifier._cached_reliability(domain):
+                continue
+            domains.add(domain)
+            requests.append(self._request(
+                f"reliability-{domain}", _RELIABILITY_SYSTEM, _reliability_prompt(reported.news_link, content), 500
+            ))
+        return requests
+
+    def _request(self, custom_id: str, system_prompt: str, user_content: str, max_tokens: int) -> Dict[str, Any]:
+        """A batch input line for one chat completion."""
+        return {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": BATCH_ENDPOINT,
+            "body": {
+                "model": self.model,
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_content}
+                ],
+                "temperature": 0.3,
+                "max_tokens": max_tokens,
+                "response_format": {"type": "json_object"}
+            }
+        }
+
+    async def _run_batch(self, requests: List[Dict[str, Any]]) -> Dict[str, str]:
+        """Submit the requests as a batch job, wait for it and return each reply's content by custom_id."""
+        client = self.verifier.client
+        payload = b"\n".join(orjson.dumps(request) for request in requests)
+        input_file = await client.files.create(file=("verification_batch.jsonl", payload), purpose="batch")
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window="24h"
+        )
+        logging.info(f"Submitted batch {batch.id} with {len(requests)} requests")
+
+        while batch.status not in TERMINAL_STATUSES:
+            await asyncio.sleep(self.poll_interval)
+            batch = await client.batches.retrieve(batch.id)
+            counts = batch.request_counts
+            if counts:
+                logging.info(f"Batch {batch.id} {batch.status}: {counts.completed}/{counts.total} completed")
+
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+        output = await client.files.content(batch.output_file_id)
+        replies = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            response = record.get('response') or {}
+            if response.get('status_code') != 200:
+                logging.error(f"Batch request {record.get('custom_id')} failed: {record.get('error') or response}")
+                continue
+            replies[record['custom_id']] = response['body']['choices'][0]['message']['content']
+        return replies
+
+    def _build_results(
+        self, fetched: List[Tuple[FundingAnnouncement, str]], replies: Dict[str, str]
+    ) -> List[VerificationResult]:
+        """Join the batch replies back to their announcements."""
+        results = []
+        for index, (reported, _) in enumerate(fetched):
+            reply = replies.get(f"analysis-{index}")
+            if reply is None:
+                continue
+            try:
+                analysis = orjson.loads(reply)
+            except orjson.JSONDecodeError as e:
+                logging.error(f"Invalid batch reply for {reported.company_name}: {str(e)}")
+                continue
+            source_reliability = self._source_reliability(reported.news_link, replies)
+            results.append(self.verifier._parse_verification(
+                reported, analysis.get('verification') or {}, source_reliability
+            ))
+        return results
+
+    def _source_reliability(self, url: str, replies: Dict[str, str]) -> SourceReliability:
+        """The domain's reliability from the cache or its batch reply, caching the latter."""
+        domain = urlparse(url).netloc.lower()
+        cached = self.verifier._cached_reliability(domain)
+        if cached:
+            return cached
+
+        reply: Optional[str] = replies.get(f"reliability-{domain}")
+        try:
+            data = orjson.loads(reply) if reply else None
+        except orjson.JSONDecodeError as e:
+            logging.warning(f"Invalid batch reliability reply for {domain}: {str(e)}")
+            data = None
+        if data is None:
+            # Default moderate score, not cached
+            return self.verifier._parse_source_reliability(url, {})
+
+        source_reliability = self.verifier._parse_source_reliability(url, data)
+        self.verifier._domain_reliability[domain] = (source_reliability, time.monotonic())
+        return source_reliability
@@ -0,0 +1,30 @@
+import asyncio
+from typing import Dict
+
+import httpx
+from openai import AsyncOpenAI, DefaultAioHttpClient
+
+# One client per API key for the whole process, so every analyzer and verifier
+# shares a single pool of keep-alive connections to the API
+_clients: Dict[str, AsyncOpenAI] = {}
+
+
+def get_client(api_key: str) -> AsyncOpenAI:
+    """Shared AsyncOpenAI client for api_key over the pooled aiohttp transport."""
+    client = _clients.get(api_key)
+    if client is None:
+        client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=DefaultAioHttpClient(
+                limits=httpx.Limits(max_connections=200, max_keepalive_connections=100, keepalive_expiry=60)
+            )
+        )
+        _clients[api_key] = client
+    return client
+
+
+async def close_clients() -> None:
+    """Close every shared client; call once at process shutdown."""
+    clients = list(_clients.values())
+    _clients.clear()
+    await asyncio.gather(*(client.close() for client in clients))
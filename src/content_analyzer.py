@@ -1,14 +1,45 @@
+import asyncio
 import logging
 from typing import Optional, Dict, Any, List, Tuple
-import json
+import httpx
+import openai
+import orjson
+from functools import lru_cache
 from urllib.parse import urlparse
-from openai import OpenAI
+import pandas as pd
+from .clients import get_client
+from .llm_cache import LLMCache
 from .types import ExtractedDetails, SourceReliability
 
+# Small JSON-mode model for extraction, GPT-4 only when its reply doesn't validate
+MODEL = "gpt-4o-mini"
+FALLBACK_MODEL = "gpt-4-turbo-preview"
+
+# Characters of a document sent for analysis, enough for a full press release. Both
+# the batched and the single-document path use it, so an article extracts the same
+# way whichever path it takes
+MAX_DOCUMENT_CHARS = 8000
+
+# Extraction and quality rubric, sent once per call as the system message. It is
+# static so every request shares its prefix in OpenAI's prompt cache; keep
+# per-call data in the user message
+_ANALYSIS_SYSTEM = """Extract funding details from funding announcement text as "extracted", a JSON object with keys company_name(str), amount(float, millions), round_type(str), date(YYYY-MM-DD), investors(list[str]), description(str).
+Score the text's quality as "quality_score", a float in 0-1 for clarity, professional style, key details present (amount, date, investors) and no promotional language: 0.0-0.3 poor or missing key details, 0.4-0.6 average, 0.7-0.8 good, 0.9-1.0 excellent with all details.
+Return ONLY JSON. For a single text: {"extracted": {...}, "quality_score": 0.0}
+For a JSON array of documents: {"results": [{"id": "the document's id", "extracted": {...}, "quality_score": 0.0}]}"""
+
+@lru_cache(maxsize=4096)
+def _netloc(url: str) -> str:
+    """Lowercased host of a URL without a leading www., so www.reuters.com matches reuters.com."""
+    return urlparse(url).netloc.lower().removeprefix("www.")
+
 class ContentAnalyzer:
     def __init__(self, api_key: str):
         """Initialize the content analyzer."""
-        self.client = OpenAI(api_key=api_key)
+        # Process-wide client: analyzers share its pooled keep-alive connections
+        self.client = get_client(api_key)
+        # Exact and near-duplicate content skips the model call
+        self.cache = LLMCache(self.client)
         
         # Configure verified domains and their base reliability scores
         self.verified_domains = {
@@ -22,90 +53,175 @@ class ContentAnalyzer:
             'businesswire.com': 0.8,
             'prnewswire.com': 0.8
         }
+        # Lookup table keyed the way _netloc normalises hosts
+        self._domain_score = {
+            domain.lower().removeprefix("www."): score
+            for domain, score in self.verified_domains.items()
+        }
+    
+    async def __aenter__(self):
+        return self
     
-    def analyze_content(self, content: str, source_url: str) -> Tuple[ExtractedDetails, SourceReliability]:
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        # The shared client outlives the analyzer, see clients.close_clients
+        pass
+    
+    async def analyze_content(self, content: str, source_url: str) -> Tuple[ExtractedDetails, SourceReliability]:
         """Analyze content and extract funding details."""
         try:
-            # Extract details using OpenAI
-            extracted_details = self._extract_details(content)
-            
-            # Assess source reliability
-            source_reliability = self._assess_source_reliability(source_url, content)
+            # Details and quality score come from one call, reused for seen content
+            result = await self._analyze_cached(content)
+            extracted_details, content_quality = self._parse_analysis(result)
             
-            return extracted_details, source_reliability
+            return extracted_details, self._assess_source_reliability(source_url, content_quality)
             
         except Exception as e:
             logging.error(f"Error analyzing content: {str(e)}")
             raise
     
-    def _extract_details(self, content: str) -> ExtractedDetails:
-        """Extract funding details from content using OpenAI."""
+    async def analyze_contents(self, items: List[Tuple[str, str, str]]) -> Dict[str, Tuple[ExtractedDetails, SourceReliability]]:
+        """Analyze (id, content, source_url) items, analyzing many documents per call."""
         try:
-            # Prepare prompt for OpenAI
-            prompt = f"""Extract funding announcement details from the following text.
-            You must respond with ONLY a valid JSON object containing these fields:
-            {{
-                "company_name": "Company name (string)",
-                "amount": "Funding amount in millions (float)",
-                "round_type": "Type of funding round (string)",
-                "date": "Announcement date (YYYY-MM-DD string)",
-                "investors": ["List of investors if mentioned (array of strings)"],
-                "description": "Brief description of the company/funding (string)"
-            }}
-            
-            Text: {content}
-            
-            Respond with ONLY the JSON object, no other text."""
-            
-            # Call OpenAI API
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a precise funding details extractor. You must respond with ONLY valid JSON."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1
-            )
+            results = await self._analyze_batch([(item_id, content) for item_id, content, _ in items])
             
-            # Parse response
-            try:
-                result = json.loads(response.choices[0].message.content)
-            except json.JSONDecodeError as e:
-                logging.error(f"Invalid JSON response: {response.choices[0].message.content}")
-                raise ValueError("OpenAI response was not valid JSON")
-            
-            # Validate required fields
-            required_fields = ['company_name', 'amount', 'round_type', 'date']
-            missing_fields = [field for field in required_fields if field not in result]
-            if missing_fields:
-                raise ValueError(f"Missing required fields in OpenAI response: {missing_fields}")
-            
-            # Create ExtractedDetails object
-            return ExtractedDetails(
-                company_name=str(result['company_name']),
-                amount=float(result['amount']),
-                round_type=str(result['round_type']),
-                date=str(result['date']),
-                investors=result.get('investors', []),
-                description=result.get('description', '')
-            )
+            analyses = {}
+            for item_id, _, source_url in items:
+                if item_id not in results:
+                    logging.warning(f"No details extracted for document {item_id}")
+                    continue
+                try:
+                    extracted_details, content_quality = self._parse_analysis(results[item_id])
+                except (KeyError, TypeError, ValueError) as e:
+                    logging.warning(f"Skipping invalid extraction for document {item_id}: {str(e)}")
+                    continue
+                analyses[item_id] = (
+                    extracted_details,
+                    self._assess_source_reliability(source_url, content_quality)
+                )
+            return analyses
             
         except Exception as e:
-            logging.error(f"Error extracting details: {str(e)}")
+            logging.error(f"Error analyzing contents: {str(e)}")
             raise
     
-    def _assess_source_reliability(self, source_url: str, content: str) -> SourceReliability:
+    async def _analyze_batch(self, items: List[Tuple[str, str]], batch_size: int = 10) -> Dict[str, Dict[str, Any]]:
+        """Analyze (id, content) pairs, sending batch_size documents per OpenAI call."""
+        batches = [items[start:start + batch_size] for start in range(0, len(items), batch_size)]
+        results = {}
+        for batch_results in await asyncio.gather(*(self._analyze_batch_raw(batch) for batch in batches)):
+            results.update(batch_results)
+        return results
+    
+    async def _analyze_batch_raw(self, batch: List[Tuple[str, str]]) -> Dict[str, Dict[str, Any]]:
+        """Analyze one batch of (id, content) pairs in a single OpenAI call, keyed by id."""
+        documents = orjson.dumps([
+            {"id": str(item_id), "text": content[:MAX_DOCUMENT_CHARS]}
+            for item_id, content in batch
+        ]).decode()
+        try:
+            result = await self._complete_json(f"Documents:\n{documents}")
+            entries = result.get('results', [])
+        except (ValueError, openai.OpenAIError, httpx.HTTPError) as e:
+            # One failed batch mustn't fail the others gathered with it
+            logging.warning(f"Batch analysis failed, analyzing documents one by one: {str(e)}")
+            entries = []
+        
+        results = {}
+        for entry in entries:
+            if not isinstance(entry, dict) or 'id' not in entry:
+                continue
+            try:
+                self._parse_analysis(entry)
+            except (KeyError, TypeError, ValueError):
+                continue
+            results[str(entry['id'])] = entry
+        
+        # Documents the batch reply missed or got wrong go through the single-document path
+        retry = [(str(item_id), content) for item_id, content in batch if str(item_id) not in results]
+        retried = await asyncio.gather(
+            *(self._analyze_cached(content) for _, content in retry),
+            return_exceptions=True
+        )
+        for (item_id, _), result in zip(retry, retried):
+            if isinstance(result, Exception):
+                logging.warning(f"Error analyzing document {item_id}: {str(result)}")
+            else:
+                results[item_id] = result
+        return results
+    
+    async def _analyze_cached(self, content: str) -> Dict[str, Any]:
+        """Analysis JSON of content, from the cache when the same or similar content was seen."""
+        return await self.cache.get_or_compute(content, lambda: self._analyze_raw(content), "analysis")
+    
+    async def _analyze_raw(self, content: str) -> Dict[str, Any]:
+        """Ask OpenAI for the funding details and quality score of content as one JSON object.
+        
+        The reply of the small model is validated and the call is repeated on the
+        fallback model if it doesn't hold the required fields. An invalid fallback
+        reply raises, so it is never cached.
+        """
+        prompt = f"Text:\n{content[:MAX_DOCUMENT_CHARS]}"
+        
+        try:
+            result = await self._complete_json(prompt)
+            self._parse_analysis(result)
+            return result
+        except (KeyError, TypeError, ValueError) as e:
+            logging.warning(f"Invalid analysis from {MODEL}, retrying with {FALLBACK_MODEL}: {str(e)}")
+            result = await self._complete_json(prompt, model=FALLBACK_MODEL)
+            self._parse_analysis(result)
+            return result
+    
+    async def _complete_json(self, prompt: str, model: str = MODEL) -> Dict[str, Any]:
+        """Send prompt after the static analysis instructions in JSON mode and decode the reply."""
+        response = await self.client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": _ANALYSIS_SYSTEM},
+                {"role": "user", "content": prompt}
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.1
+        )
+        return orjson.loads(response.choices[0].message.content)
+    
+    def _parse_analysis(self, result: Dict[str, Any]) -> Tuple[ExtractedDetails, float]:
+        """Split an analysis JSON object into extracted details and a 0-1 quality score."""
+        extracted_details = self._to_extracted_details(result.get('extracted') or {})
+        
+        try:
+            content_quality = min(max(float(result['quality_score']), 0.0), 1.0)
+        except (KeyError, TypeError, ValueError):
+            logging.warning(f"Could not parse quality score: {result.get('quality_score')}")
+            content_quality = 0.5
+        
+        return extracted_details, content_quality
+    
+    def _to_extracted_details(self, result: Dict[str, Any]) -> ExtractedDetails:
+        """Validate an extraction JSON object and convert it to ExtractedDetails."""
+        required_fields = ['company_name', 'amount', 'round_type', 'date']
+        missing_fields = [field for field in required_fields if field not in result]
+        if missing_fields:
+            raise ValueError(f"Missing required fields in OpenAI response: {missing_fields}")
+        
+        return ExtractedDetails(
+            company_name=str(result['company_name']),
+            amount=float(result['amount']),
+            round_type=str(result['round_type']),
+            date=str(result['date']),
+            investors=result.get('investors', []),
+            description=result.get('description', '')
+        )
+    
+    def _assess_source_reliability(self, source_url: str, content_quality: float) -> SourceReliability:
         """Assess the reliability of the content source."""
         try:
             # Get domain from URL
-            domain = urlparse(source_url).netloc.lower()
+            domain = _netloc(source_url)
             
             # Check if domain is verified
-            is_verified = domain in self.verified_domains
-            base_reliability = self.verified_domains.get(domain, 0.5)
-            
-            # Assess content quality
-            content_quality = self._assess_content_quality(content)
+            is_verified = domain in self._domain_score
+            base_reliability = self._domain_score.get(domain, 0.5)
             
             # Calculate overall score
             overall_score = (base_reliability * 0.7) + (content_quality * 0.3)
@@ -121,62 +237,10 @@ class ContentAnalyzer:
         except Exception as e:
             logging.error(f"Error assessing source reliability: {str(e)}")
             raise
-    
-    def _assess_content_quality(self, content: str) -> float:
-        """Assess the quality of the content using OpenAI."""
-        try:
-            prompt = f"""Assess the quality and professionalism of this funding announcement content.
-            Consider:
-            1. Clarity and completeness of information
-            2. Professional writing style
-            3. Presence of key details (amount, date, investors)
-            4. Absence of promotional/marketing language
-            
-            Return ONLY a single number between 0 and 1, where:
-            0.0-0.3: Poor quality, unprofessional, or missing key details
-            0.4-0.6: Average quality, some issues or missing information
-            0.7-0.8: Good quality, professional, most details present
-            0.9-1.0: Excellent quality, highly professional, all details present
-            
-            Content: {content}
-            
-            Score (respond with ONLY the number):"""
-            
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a content quality assessor. You must respond with ONLY a number between 0 and 1."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1
-            )
-            
-            # Extract score from response
-            score_text = response.choices[0].message.content.strip()
-            try:
-                score = float(score_text)
-                return min(max(score, 0.0), 1.0)  # Ensure score is between 0 and 1
-            except ValueError:
-                logging.warning(f"Could not parse quality score: {score_text}")
-                return 0.5
-            
-        except Exception as e:
-            logging.error(f"Error assessing content quality: {str(e)}")
-            return 0.5  # Default to medium quality on error
 
-def normalize_date(date_str: str) -> Optional[str]:
-    """Normalize date format to YYYY-MM-DD."""
-    if pd.isna(date_str) or not date_str:
-        return None
-    try:
-        if isinstance(date_str, str):
-            date_obj = pd.to_datetime(date_str)
-        else:
-            date_obj = pd.to_datetime(date_str)
-        return date_obj.strftime('%Y-%m-%d')
-    except Exception as e:
-        logging.warning(f"Error parsing date '{date_str}': {str(e)}")
-        return None
+def normalize_dates(dates: pd.Series) -> pd.Series:
+    """Normalize a column of dates in any format to YYYY-MM-DD, missing or unparseable ones to NaN."""
+    return pd.to_datetime(dates, errors='coerce', format='mixed').dt.strftime('%Y-%m-%d')
 
 def main():
     """Main function to run the content analyzer."""
@@ -218,8 +282,9 @@ def main():
         }
     ]
     
-    # Save test data
+    # Save test data, dates parsed in one pass over the column
     test_df = pd.DataFrame(test_data)
+    test_df["date"] = normalize_dates(test_df["date"])
     data_dir = Path("data")
     data_dir.mkdir(exist_ok=True)
     test_df.to_csv(data_dir / "test_announcements.csv", index=False)
@@ -1,6 +1,6 @@
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
 from .data_operations import load_csv
 
 def analyze_data_structure(file_path: str):
@@ -45,22 +45,25 @@ def create_visualizations(df: pd.DataFrame):
     """Create visualizations for funding analysis"""
     plt.figure(figsize=(12, 6))
     
-    # Distribution des montants de financement
+    # Distribution des montants de financement, binned in NumPy and drawn as one bar call
     plt.subplot(1, 2, 1)
-    sns.histplot(data=df, x='Amount (USD M)', bins=50)
+    amounts = df['Amount (USD M)'].dropna().to_numpy(dtype=float)
+    counts, edges = np.histogram(amounts, bins=50)
+    plt.bar(edges[:-1], counts, width=np.diff(edges), align='edge')
     plt.title('Distribution des Montants de Financement')
     plt.xlabel('Montant (USD M)')
     
     # Évolution temporelle
     plt.subplot(1, 2, 2)
-    yearly_amounts = df.groupby('Year')['Amount (USD M)'].sum()
-    yearly_amounts.plot(kind='bar')
+    yearly_amounts = df.groupby('Year', sort=True)['Amount (USD M)'].sum()
+    plt.bar(yearly_amounts.index.to_numpy(dtype=int), yearly_amounts.to_numpy(dtype=float))
     plt.title('Montant Total de Financement par Année')
     plt.xlabel('Année')
     plt.ylabel('Montant Total (USD M)')
     
     plt.tight_layout()
-    plt.savefig('data/funding_analysis.png')
+    plt.savefig('data/funding_analysis.png', dpi=100, bbox_inches='tight')
+    plt.close()
     print("\nGraphiques sauvegardés dans 'data/funding_analysis.png'")
 
 if __name__ == "__main__":
@@ -5,7 +5,8 @@ from typing import Optional
 def load_csv(file_path: str) -> Optional[pd.DataFrame]:
     """Load a CSV file into a pandas DataFrame."""
     try:
-        df = pd.read_csv(file_path)
+        # Multithreaded Arrow parser, Arrow-backed columns
+        df = pd.read_csv(file_path, engine="pyarrow", dtype_backend="pyarrow")
         print(f"Successfully loaded CSV with {len(df)} rows")
         return df
     except Exception as e:
@@ -10,13 +10,12 @@ def load_verification_data():
 
 def analyze_amount_differences(extracted_df):
     """Analyze the differences between reported and extracted amounts"""
-    extracted_df['Amount_Difference'] = abs(
-        pd.to_numeric(extracted_df['Reported Amount'], errors='coerce') - 
-        pd.to_numeric(extracted_df['Extracted Amount'], errors='coerce')
-    )
+    reported = pd.to_numeric(extracted_df['Reported Amount'], errors='coerce')
+    extracted = pd.to_numeric(extracted_df['Extracted Amount'], errors='coerce')
+    extracted_df['Amount_Difference'] = (reported - extracted).abs()
+    # No percentage against a zero reported amount
     extracted_df['Amount_Difference_Percentage'] = (
-        extracted_df['Amount_Difference'] / 
-        pd.to_numeric(extracted_df['Reported Amount'], errors='coerce')
+        extracted_df['Amount_Difference'] / reported.replace(0, np.nan)
     ) * 100
     
     return {
@@ -28,14 +27,22 @@ def analyze_amount_differences(extracted_df):
 
 def analyze_round_type_matches(extracted_df):
     """Analyze the matches between reported and extracted round types"""
-    extracted_df['Round_Match'] = (
-        extracted_df['Reported Round'].str.lower() == 
-        extracted_df['Extracted Round'].str.lower()
-    )
+    # Both columns share one categorical vocabulary; only its distinct labels are
+    # lowercased, then rows compare as integer codes
+    rounds = pd.Categorical(pd.concat(
+        [extracted_df['Reported Round'], extracted_df['Extracted Round']], ignore_index=True
+    ))
+    # Trailing -1 so a missing round's code (-1) maps to itself
+    canonical = np.append(pd.factorize(rounds.categories.astype(str).str.lower())[0], -1)
+    codes = canonical[rounds.codes]
+    reported_codes, extracted_codes = np.split(codes, 2)
+    # Missing rounds (code -1) never match
+    extracted_df['Round_Match'] = (reported_codes == extracted_codes) & (reported_codes >= 0)
     
+    total_matches = extracted_df['Round_Match'].sum()
     return {
-        'total_matches': extracted_df['Round_Match'].sum(),
-        'match_rate': (extracted_df['Round_Match'].sum() / len(extracted_df)) * 100
+        'total_matches': total_matches,
+        'match_rate': (total_matches / len(extracted_df)) * 100
     }
 
 def perform_detailed_analysis():
@@ -45,54 +52,55 @@ def perform_detailed_analysis():
     # Merge dataframes
     analysis_df = pd.merge(extracted_df, verification_df, on='Company')
     
-    # 1. Compare Extracted Details
+    # 1. Compare Extracted Details (adds the difference and match columns to analysis_df)
     amount_analysis = analyze_amount_differences(analysis_df)
     round_analysis = analyze_round_type_matches(analysis_df)
     
     # 2. Verification Logic Analysis
+    verified_entries = (analysis_df['Verification Status'] == 'verified').sum()
     verification_analysis = {
         'total_entries': len(analysis_df),
-        'verified_entries': len(analysis_df[analysis_df['Verification Status'] == 'verified']),
-        'verification_rate': (len(analysis_df[analysis_df['Verification Status'] == 'verified']) / len(analysis_df)) * 100,
+        'verified_entries': verified_entries,
+        'verification_rate': (verified_entries / len(analysis_df)) * 100,
         'mean_confidence': analysis_df['Confidence Score'].mean(),
         'median_confidence': analysis_df['Confidence Score'].median()
     }
     
+    # One timestamp for every detail row and the summary
+    analysis_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    
     # Create detailed results
-    detailed_results = []
-    for _, row in analysis_df.iterrows():
-        result = {
-            'Company': row['Company'],
-            'Reported_Amount': row['Reported Amount'],
-            'Extracted_Amount': row['Extracted Amount'],
-            'Amount_Difference': abs(
-                pd.to_numeric(row['Reported Amount'], errors='coerce') - 
-                pd.to_numeric(row['Extracted Amount'], errors='coerce')
-            ),
-            'Amount_Difference_Percentage': (
-                abs(pd.to_numeric(row['Reported Amount'], errors='coerce') - 
-                    pd.to_numeric(row['Extracted Amount'], errors='coerce')) / 
-                pd.to_numeric(row['Reported Amount'], errors='coerce')
-            ) * 100 if pd.to_numeric(row['Reported Amount'], errors='coerce') != 0 else np.nan,
-            'Reported_Round': row['Reported Round'],
-            'Extracted_Round': row['Extracted Round'],
-            'Round_Match': row['Reported Round'].lower() == row['Extracted Round'].lower() if pd.notna(row['Reported Round']) and pd.notna(row['Extracted Round']) else False,
-            'Confidence_Score': row['Confidence Score'],
-            'Verification_Status': row['Verification Status'],
-            'Matches': row['Matches'],
-            'Mismatches': row['Mismatches'],
-            'News_URL': row['News URL'],
-            'Analysis_Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
-        detailed_results.append(result)
+    detailed_df = analysis_df.rename(columns={
+        'Reported Amount': 'Reported_Amount',
+        'Extracted Amount': 'Extracted_Amount',
+        'Reported Round': 'Reported_Round',
+        'Extracted Round': 'Extracted_Round',
+        'Confidence Score': 'Confidence_Score',
+        'Verification Status': 'Verification_Status',
+        'News URL': 'News_URL'
+    })[[
+        'Company',
+        'Reported_Amount',
+        'Extracted_Amount',
+        'Amount_Difference',
+        'Amount_Difference_Percentage',
+        'Reported_Round',
+        'Extracted_Round',
+        'Round_Match',
+        'Confidence_Score',
+        'Verification_Status',
+        'Matches',
+        'Mismatches',
+        'News_URL'
+    ]].assign(Analysis_Date=analysis_date)
     
     # Save detailed results
-    detailed_df = pd.DataFrame(detailed_results)
-    detailed_df.to_csv("results/detailed_analysis.csv", index=False)
+    # Written in chunks so the formatted CSV text is never held for all rows at once
+    detailed_df.to_csv("results/detailed_analysis.csv", index=False, chunksize=50_000)
     
     # Create summary report
     summary = {
-        'Analysis_Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'Analysis_Date': analysis_date,
         'Total_Entries': verification_analysis['total_entries'],
         'Verified_Entries': verification_analysis['verified_entries'],
         'Verification_Rate': verification_analysis['verification_rate'],
@@ -0,0 +1,142 @@
+import asyncio
+import hashlib
+import logging
+import os
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import numpy as np
+import orjson
+from openai import AsyncOpenAI
+
+
+class LLMCache:
+    """Two-tier cache of LLM results keyed by the text they were computed from.
+
+    The exact tier stores one JSON file per SHA-256 of the whitespace-normalised
+    text. On an exact miss, the semantic tier embeds the text and reuses the
+    result of any earlier text whose cosine similarity reaches the threshold,
+    so syndicated copies of the same press release share one model call.
+    """
+
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        directory: str = "cache",
+        similarity_threshold: float = 0.95,
+        embedding_model: str = "text-embedding-3-small"
+    ):
+        self.client = client
+        self.directory = directory
+        self.similarity_threshold = similarity_threshold
+        self.embedding_model = embedding_model
+        # kind -> normalised embeddings (one row per entry) and their results
+        self._vectors: Dict[str, np.ndarray] = {}
+        self._values: Dict[str, List[Any]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def get_or_compute(self, key_text: str, compute_fn: Callable[[], Awaitable[Any]], kind: str) -> Any:
+        """Return the cached result for key_text, computing and caching it with compute_fn on a miss.
+
+        compute_fn must return a JSON-serialisable value; its exceptions propagate
+        and nothing is cached for them.
+        """
+        path = self._path(kind, key_text)
+        entry = await asyncio.to_thread(self._read, path)
+        if entry is not None:
+            return entry['value']
+
+        await self._load_index(kind)
+        embedding = await self._embed(key_text)
+        value = self._nearest(kind, embedding) if embedding is not None else None
+        if value is None:
+            value = await compute_fn()
+            if embedding is not None:
+                self._add(kind, embedding, value)
+
+        entry = {'value': value, 'embedding': embedding.tolist() if embedding is not None else None}
+        await asyncio.to_thread(self._write, path, entry)
+        return value
+
+    def _path(self, kind: str, key_text: str) -> str:
+        """File holding the exact-tier entry for key_text."""
+        normalized = ' '.join(key_text.split())
+        digest = hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, kind, f"{digest}.json")
+
+    def _read(self, path: str) -> Optional[Dict[str, Any]]:
+        """Read a cache entry, or None if it is missing or unreadable."""
+        try:
+            with open(path, 'rb') as f:
+                return orjson.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, orjson.JSONDecodeError) as e:
+            logging.warning(f"Ignoring unreadable cache entry {path}: {str(e)}")
+            return None
+
+    def _write(self, path: str, entry: Dict[str, Any]) -> None:
+        """Write a cache entry atomically."""
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(entry))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logging.warning(f"Error writing cache entry {path}: {str(e)}")
+
+    async def _load_index(self, kind: str) -> None:
+        """Load the embeddings stored for kind into the semantic tier, once."""
+        lock = self._locks.setdefault(kind, asyncio.Lock())
+        async with lock:
+            if kind in self._vectors:
+                return
+            entries = await asyncio.to_thread(self._read_all, os.path.join(self.directory, kind))
+            entries = [entry for entry in entries if entry.get('embedding')]
+            self._values[kind] = [entry['value'] for entry in entries]
+            self._vectors[kind] = (
+                np.array([entry['embedding'] for entry in entries], dtype=np.float32)
+                if entries else np.empty((0, 0), dtype=np.float32)
+            )
+
+    def _read_all(self, directory: str) -> List[Dict[str, Any]]:
+        """Read every cache entry in a directory."""
+        if not os.path.isdir(directory):
+            return []
+        entries = []
+        for name in os.listdir(directory):
+            if name.endswith('.json'):
+                entry = self._read(os.path.join(directory, name))
+                if entry is not None:
+                    entries.append(entry)
+        return entries
+
+    async def _embed(self, text: str) -> Optional[np.ndarray]:
+        """Normalised embedding of text, or None if the embedding call fails."""
+        try:
+            response = await self.client.embeddings.create(model=self.embedding_model, input=text)
+            vector = np.array(response.data[0].embedding, dtype=np.float32)
+            return vector / np.linalg.norm(vector)
+        except Exception as e:
+            logging.warning(f"Error embedding text for the semantic cache: {str(e)}")
+            return None
+
+    def _nearest(self, kind: str, embedding: np.ndarray) -> Any:
+        """Result of the most similar cached text if it reaches the threshold, else None."""
+        vectors = self._vectors.get(kind)
+        if vectors is None or not len(vectors):
+            return None
+        scores = vectors @ embedding
+        best = int(np.argmax(scores))
+        if scores[best] < self.similarity_threshold:
+            return None
+        return self._values[kind][best]
+
+    def _add(self, kind: str, embedding: np.ndarray, value: Any) -> None:
+        """Add a computed result to the semantic tier."""
+        vectors = self._vectors.get(kind)
+        if vectors is None or not len(vectors):
+            self._vectors[kind] = embedding[np.newaxis, :]
+        else:
+            self._vectors[kind] = np.vstack([vectors, embedding])
+        self._values.setdefault(kind, []).append(value)
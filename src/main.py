@@ -1,10 +1,14 @@
 import os
+import argparse
 import asyncio
 import logging
 from dotenv import load_dotenv
 import pandas as pd
+from pydantic import ValidationError
 from tqdm import tqdm
 from src.ai_verifier import AIFundingVerifier
+from src.batch_submitter import BatchSubmitter
+from src.clients import close_clients
 from src.pydantic_models import FundingAnnouncement
 
 # Configure logging
@@ -17,44 +21,56 @@ logging.basicConfig(
     ]
 )
 
+# Announcement CSV columns, in file order, and their Arrow-backed types
+ANNOUNCEMENT_DTYPES = {
+    'id': 'string[pyarrow]',
+    'company_name': 'string[pyarrow]',
+    'company_url': 'string[pyarrow]',
+    'round_type': 'string[pyarrow]',
+    'amount': 'float64[pyarrow]',
+    'year': 'int32[pyarrow]',
+    'month': 'int32[pyarrow]',
+    'investors': 'string[pyarrow]',
+    'news_link': 'string[pyarrow]',
+    'standardised_round': 'string[pyarrow]'
+}
+
 def load_announcements(csv_path: str) -> list[FundingAnnouncement]:
     """Load funding announcements from CSV file."""
     if not os.path.exists(csv_path):
         raise FileNotFoundError(f"CSV file not found: {csv_path}")
     
-    df = pd.read_csv(csv_path, header=None, names=[
-        'id', 'company_name', 'company_url', 'round_type', 'amount', 
-        'year', 'month', 'investors', 'news_link'
-    ])
-    
-    announcements = []
-    for _, row in df.iterrows():
-        try:
-            # Convert empty strings to None for optional fields
-            investors = row['investors'] if pd.notna(row['investors']) else None
-            news_link = row['news_link'] if pd.notna(row['news_link']) else None
-            month = int(row['month']) if pd.notna(row['month']) else None
-            
-            announcement = FundingAnnouncement(
-                id=str(row['id']),
-                company_name=row['company_name'],
-                company_url=row['company_url'],
-                round_type=row['round_type'],
-                amount=float(row['amount']),
-                year=int(row['year']),
-                month=month,
-                investors=investors,
-                news_link=news_link
-            )
-            announcements.append(announcement)
-        except Exception as e:
-            logging.error(f"Error processing row {row}: {str(e)}")
-            continue
+    # Skip the header row and name the columns ourselves
+    df = pd.read_csv(
+        csv_path,
+        engine="pyarrow",
+        skiprows=1,
+        header=None,
+        names=list(ANNOUNCEMENT_DTYPES),
+        dtype=ANNOUNCEMENT_DTYPES,
+        dtype_backend="pyarrow"
+    )
     
-    return announcements
+    # Missing values are already None; validate every row in one pydantic-core call
+    records = df.to_dict(orient="records")
+    try:
+        return FundingAnnouncement.validate_batch(records)
+    except ValidationError as e:
+        row_errors = {}
+        for error in e.errors():
+            row_errors.setdefault(error['loc'][0], []).append(f"{error['loc'][-1]}: {error['msg']}")
+        for index, messages in row_errors.items():
+            logging.error(f"Error processing row {records[index]}: {'; '.join(messages)}")
+        
+        return FundingAnnouncement.validate_batch(
+            [record for index, record in enumerate(records) if index not in row_errors]
+        )
+
+async def main(batch: bool = False):
+    """Main function to run the verification process.
 
-async def main():
-    """Main function to run the verification process."""
+    With batch, the LLM calls go through one OpenAI Batch API job instead of live requests.
+    """
     load_dotenv()
     
     openai_api_key = os.getenv("OPENAI_API_KEY")
@@ -83,25 +99,37 @@ async def main():
         pbar.refresh()  # Force refresh the display
     
     try:
-        async with AIFundingVerifier(openai_api_key) as verifier:
-            # Set the callback in the verifier
-            verifier.on_progress = update_progress
-            
-            # Process announcements in larger batches
-            batch_size = 10
-            for i in range(0, total_announcements, batch_size):
-                batch = announcements[i:i + batch_size]
-                await verifier.verify_batch(batch)
+        async with AIFundingVerifier(
+            openai_api_key,
+            max_rpm=3000,
+            max_tpm=90000,
+            max_concurrent=50
+        ) as verifier:
+            if batch:
+                # Results arrive all at once when the batch job completes
+                await BatchSubmitter(verifier).run(announcements)
+                pbar.update(total_announcements)
+            else:
+                # Set the callback in the verifier
+                verifier.on_progress = update_progress
                 
-                # Reduced delay between batches
-                await asyncio.sleep(0.5)
+                # One run keeps max_concurrent announcements in flight, throttled by the rate limiter
+                await verifier.verify_batch(announcements)
                 
     except Exception as e:
         logging.error(f"Error during verification: {str(e)}")
         raise
     finally:
+        await close_clients()
         pbar.close()
         logging.info("Verification process completed")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Verify funding announcements against their sources")
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="submit the LLM calls as one OpenAI Batch API job (cheaper, completes within 24h)"
+    )
+    args = parser.parse_args()
+    asyncio.run(main(batch=args.batch))
\ No newline at end of file
@@ -1,9 +1,11 @@
-from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
-from datetime import datetime, date
+from typing import Dict, Iterator, List, Optional
+from dataclasses import dataclass
+from datetime import date
 import os
-import json
-from pydantic import BaseModel, Field, validator
+import time
+import numpy as np
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, validator
 from enum import Enum
 
 @dataclass
@@ -14,7 +16,7 @@ class FundingDetails:
     date: Optional[str]
     additional_details: Optional[str]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SourceReliability:
     domain: str
     is_verified_publisher: bool
@@ -31,6 +33,21 @@ class Discrepancy:
     severity: float
     impact: str
 
+# Report directories already created by this process
+_CREATED_DIRS = set()
+
+def _ensure_directory(directory: str) -> None:
+    """Create directory if needed, checking the filesystem only once per directory."""
+    if directory not in _CREATED_DIRS:
+        os.makedirs(directory, exist_ok=True)
+        _CREATED_DIRS.add(directory)
+
+def _json_default(obj):
+    """orjson fallback for report parts it can't serialise natively: pydantic models, else str."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    return str(obj)
+
 @dataclass
 class VerificationReport:
     verification_id: str
@@ -47,42 +64,51 @@ class VerificationReport:
     
     def generate_summary(self) -> str:
         """Generate a human-readable summary of the verification results."""
-        summary = [
-            f"Verification Report for {self.company_name}",
-            f"ID: {self.verification_id}",
-            f"Status: {self.verification_status}",
-            f"Overall Confidence: {self.overall_confidence:.2f}",
-            "",
-            "Source Assessment:",
-            f"- URL: {self.source_url}",
-            f"- Domain: {self.source_reliability.domain}",
-            f"- Verified Publisher: {'Yes' if self.source_reliability.is_verified_publisher else 'No'}",
-            f"- Reliability Score: {self.source_reliability.reliability_score:.2f}",
-            "",
-            "Reported Details:",
-            f"- Amount: ${self.reported_details.amount}M",
-            f"- Round: {self.reported_details.round_type}",
-            f"- Date: {self.reported_details.date}",
-            "",
-            "Extracted Details:",
-            f"- Amount: ${self.extracted_details.amount}M",
-            f"- Round: {self.extracted_details.round_type}",
-            f"- Date: {self.extracted_details.date}",
-            "",
-            f"Discrepancies Found: {len(self.discrepancies)}",
-        ]
+        sr = self.source_reliability
+        rd = self.reported_details
+        ed = self.extracted_details
+        summary = f"""Verification Report for {self.company_name}
+ID: {self.verification_id}
+Status: {self.verification_status}
+Overall Confidence: {self.overall_confidence:.2f}
+
+Source Assessment:
+- URL: {self.source_url}
+- Domain: {sr.domain}
+- Verified Publisher: {'Yes' if sr.is_verified_publisher else 'No'}
+- Reliability Score: {sr.reliability_score:.2f}
+
+Reported Details:
+- Amount: ${rd.amount}M
+- Round: {rd.round_type}
+- Date: {rd.date}
+
+Extracted Details:
+- Amount: ${ed.amount}M
+- Round: {ed.round_type}
+- Date: {ed.date}
+
+Discrepancies Found: {len(self.discrepancies)}"""
         
         if self.discrepancies:
-            summary.append("Discrepancy Details:")
-            for d in self.discrepancies:
-                summary.append(f"- {d.field}: {d.reported_value} vs {d.extracted_value}")
-                summary.append(f"  Severity: {d.severity:.2f}, Impact: {d.impact}")
+            details = "\n".join([
+                f"- {d.field}: {d.reported_value} vs {d.extracted_value}\n  Severity: {d.severity:.2f}, Impact: {d.impact}"
+                for d in self.discrepancies
+            ])
+            summary = f"{summary}\nDiscrepancy Details:\n{details}"
         
-        return "\n".join(summary)
+        return summary
 
     def generate_detailed_report(self) -> str:
         """Generate a detailed human-readable report."""
-        return f"""
+        return "".join(self._iter_report_parts())
+
+    def _iter_report_parts(self) -> Iterator[str]:
+        """The detailed report in pieces, one per discrepancy, so it can be written out as it's built."""
+        sr = self.source_reliability
+        rd = self.reported_details
+        ed = self.extracted_details
+        yield f"""
 FUNDING ANNOUNCEMENT VERIFICATION REPORT
 ======================================
 Verification ID: {self.verification_id}
@@ -95,25 +121,27 @@ Company: {self.company_name}
 SOURCE ASSESSMENT
 ----------------
 Source: {self.source_url}
-Reliability Score: {self.source_reliability.reliability_score:.2f}
-Domain Reputation: {self.source_reliability.domain_age_score:.2f}
-Content Quality: {self.source_reliability.content_quality_score:.2f}
+Reliability Score: {sr.reliability_score:.2f}
+Domain Reputation: {sr.domain_age_score:.2f}
+Content Quality: {sr.content_quality_score:.2f}
 
 FUNDING DETAILS COMPARISON
 ------------------------
 Reported Details:
-- Amount: ${self.reported_details.amount}M
-- Round: {self.reported_details.round_type or 'Not specified'}
-- Date: {self.reported_details.date or 'Not specified'}
+- Amount: ${rd.amount}M
+- Round: {rd.round_type or 'Not specified'}
+- Date: {rd.date or 'Not specified'}
 
 Extracted Details:
-- Amount: ${self.extracted_details.amount}M
-- Round: {self.extracted_details.round_type or 'Not specified'}
-- Date: {self.extracted_details.date or 'Not specified'}
+- Amount: ${ed.amount}M
+- Round: {ed.round_type or 'Not specified'}
+- Date: {ed.date or 'Not specified'}
 
 DISCREPANCIES FOUND
 ------------------
-{self._format_discrepancies()}
+"""
+        yield from self._iter_discrepancies()
+        yield f"""
 
 CONFIDENCE ASSESSMENT
 -------------------
@@ -126,52 +154,38 @@ VERIFICATION RESULT
 Status: {self.verification_status.upper()}
 
 Additional Notes:
-- Source is {'' if self.source_reliability.is_verified_publisher else 'not '}a verified publisher
-- Content quality indicators: {self.source_reliability.content_quality_score:.2f}/1.0
+- Source is {'' if sr.is_verified_publisher else 'not '}a verified publisher
+- Content quality indicators: {sr.content_quality_score:.2f}/1.0
 """
 
-    def _format_discrepancies(self) -> str:
+    def _iter_discrepancies(self) -> Iterator[str]:
         if not self.discrepancies:
-            return "No discrepancies found."
+            yield "No discrepancies found."
+            return
         
-        return "\n".join(
-            f"- {d.field}: {d.reported_value} (reported) vs {d.extracted_value} (extracted)\n  Severity: {d.severity:.2f}\n  Impact: {d.impact}"
-            for d in self.discrepancies
-        )
+        separator = ""
+        for d in self.discrepancies:
+            yield f"{separator}- {d.field}: {d.reported_value} (reported) vs {d.extracted_value} (extracted)\n  Severity: {d.severity:.2f}\n  Impact: {d.impact}"
+            separator = "\n"
 
     def _format_confidence_scores(self) -> str:
-        return "\n".join(
-            f"- {key}: {value:.2f}"
-            for key, value in self.confidence_scores.items()
-        )
+        return "\n".join([f"- {key}: {value:.2f}" for key, value in self.confidence_scores.items()])
 
     def save_to_file(self, directory: str = "reports") -> str:
         """Save the report to a file and return the filename."""
         # Create directory if it doesn't exist
-        os.makedirs(directory, exist_ok=True)
+        _ensure_directory(directory)
         
         # Generate filename
-        filename = f"{directory}/{self.company_name}_{self.verification_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        filename = f"{directory}/{self.company_name}_{self.verification_id}_{time.strftime('%Y%m%d_%H%M%S')}"
         
-        # Save detailed text report
-        with open(f"{filename}_report.txt", "w") as f:
-            f.write(self.generate_detailed_report())
+        # Save detailed text report, streamed into a 64 KiB write buffer
+        with open(f"{filename}_report.txt", "w", buffering=1 << 16) as f:
+            f.writelines(self._iter_report_parts())
             
-        # Save JSON data
-        with open(f"{filename}_data.json", "w") as f:
-            json.dump({
-                'verification_id': self.verification_id,
-                'timestamp': self.timestamp,
-                'company_name': self.company_name,
-                'source_url': self.source_url,
-                'source_reliability': asdict(self.source_reliability),
-                'reported_details': asdict(self.reported_details),
-                'extracted_details': asdict(self.extracted_details),
-                'discrepancies': [asdict(d) for d in self.discrepancies],
-                'confidence_scores': self.confidence_scores,
-                'overall_confidence': self.overall_confidence,
-                'verification_status': self.verification_status
-            }, f, indent=2, default=str)
+        # Save JSON data; orjson serialises the report and its nested dataclasses itself
+        with open(f"{filename}_data.json", "wb") as f:
+            f.write(orjson.dumps(self, default=_json_default, option=orjson.OPT_INDENT_2))
             
         return filename
 
@@ -180,7 +194,29 @@ class VerificationStatus(str, Enum):
     UNVERIFIED = "UNVERIFIED"
     PENDING = "PENDING"
 
-class SourceReliability(BaseModel):
+def batch_overall_confidence(
+    confidence_scores: np.ndarray,
+    reliability_scores: np.ndarray,
+    impacts: np.ndarray,
+    offsets: np.ndarray
+) -> np.ndarray:
+    """calculate_overall_confidence for many reports at once.
+
+    impacts holds every report's discrepancy impacts back to back; report i owns
+    impacts[offsets[i]:offsets[i + 1]], so offsets has one more entry than there
+    are reports.
+    """
+    lengths = np.diff(offsets)
+    has_discrepancies = lengths > 0
+    # reduceat sums from each start to the next; empty segments are left out so
+    # their start doesn't pick up the following report's first impact
+    totals = np.zeros(len(lengths))
+    if has_discrepancies.any():
+        totals[has_discrepancies] = np.add.reduceat(impacts, offsets[:-1][has_discrepancies])
+    discrepancy_factor = 1 - np.divide(totals, lengths, out=np.zeros(len(lengths)), where=has_discrepancies)
+    return confidence_scores * reliability_scores * discrepancy_factor
+
+class SourceReliabilityModel(BaseModel):
     domain: str
     score: float = Field(ge=0.0, le=1.0)
     is_verified_publisher: bool = False
@@ -208,8 +244,10 @@ class FundingDetails(BaseModel):
     source_url: str
 
 class ExtractedDetails(FundingDetails):
+    model_config = ConfigDict(extra='ignore')
+
     confidence_score: float = Field(ge=0.0, le=1.0)
-    source_reliability: SourceReliability
+    source_reliability: SourceReliabilityModel
     discrepancies: List[Discrepancy] = []
     verification_status: VerificationStatus = VerificationStatus.PENDING
     verification_notes: Optional[str] = None
@@ -222,21 +260,33 @@ class ExtractedDetails(FundingDetails):
         discrepancy_factor = 1 - (total_impact / len(self.discrepancies))
         return self.confidence_score * self.source_reliability.score * discrepancy_factor
 
+    @classmethod
+    def overall_confidences(cls, details: List['ExtractedDetails']) -> np.ndarray:
+        """calculate_overall_confidence of every details object, computed as arrays."""
+        return batch_overall_confidence(
+            np.array([d.confidence_score for d in details], dtype=float),
+            np.array([d.source_reliability.score for d in details], dtype=float),
+            np.array([x.impact for d in details for x in d.discrepancies], dtype=float),
+            np.concatenate(([0], np.cumsum([len(d.discrepancies) for d in details])))
+        )
+
     def generate_verification_notes(self) -> str:
-        notes = [f"Verification Status: {self.verification_status}"]
-        notes.append(f"Source Reliability: {self.source_reliability.domain} ({'Verified' if self.source_reliability.is_verified_publisher else 'Unverified'} publisher, Score: {self.source_reliability.score:.2f})")
+        sr = self.source_reliability
+        notes = f"""Verification Status: {self.verification_status}
+Source Reliability: {sr.domain} ({'Verified' if sr.is_verified_publisher else 'Unverified'} publisher, Score: {sr.score:.2f})"""
         
         if self.discrepancies:
-            notes.append("\nDiscrepancies found:")
-            for discrepancy in self.discrepancies:
-                notes.append(f"- {discrepancy}")
+            details = "\n".join([f"- {discrepancy}" for discrepancy in self.discrepancies])
+            notes = f"{notes}\n\nDiscrepancies found:\n{details}"
         
-        return "\n".join(notes)
+        return notes
 
 class VerificationResult(BaseModel):
+    model_config = ConfigDict(extra='ignore')
+
     company_name: str
     verification_status: VerificationStatus
     overall_confidence: float
     source_url: str
     discrepancies: List[Discrepancy]
-    verification_notes: str
\ No newline at end of file
+    verification_notes: str
@@ -0,0 +1,57 @@
+import asyncio
+from typing import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, Tuple, TypeVar, Union
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+async def _as_async_iterator(items: Union[Iterable[T], AsyncIterable[T]]) -> AsyncIterator[T]:
+    """Iterate plain and async iterables alike."""
+    if hasattr(items, '__aiter__'):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def run_parallel(
+    items: Union[Iterable[T], AsyncIterable[T]],
+    worker: Callable[[T], Awaitable[R]],
+    max_concurrent: int
+) -> AsyncIterator[Tuple[T, Union[R, Exception]]]:
+    """Run worker over items with at most max_concurrent in flight, yielding (item, result) as each finishes.
+
+    Items are pulled lazily as slots free up, so a slow item only holds its own slot
+    instead of stalling a whole batch. A worker's exception is yielded as its result.
+    Request and token rates are left to the rate limiter inside the worker.
+    """
+    async def run(item: T) -> Tuple[T, Union[R, Exception]]:
+        try:
+            return item, await worker(item)
+        except Exception as e:
+            return item, e
+
+    iterator = _as_async_iterator(items).__aiter__()
+    pending = set()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < max_concurrent:
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending.add(asyncio.create_task(run(item)))
+
+            if not pending:
+                return
+
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        # Consumer stopped early or was cancelled: don't leave workers running
+        for task in pending:
+            task.cancel()
@@ -1,31 +1,36 @@
+import operator
+from functools import reduce
+
 import pandas as pd
 from typing import Optional
 
 from .data_operations import load_csv, save_dataframe
 
-def create_prompt(row: pd.Series) -> str:
+PROMPT_HEADER = "Given the following information:\n"
+PROMPT_FOOTER = "\nPlease analyze this data and provide insights."
+
+def create_prompts(df: pd.DataFrame) -> pd.Series:
     """
-    Creates a prompt for each row based on the data.
+    Creates a prompt for each row based on the data, one column at a time.
     Customize this function according to your specific requirements.
     """
-    prompt = f"Given the following information:\n"
-    
-    # Add each column and its value to the prompt
-    for col, value in row.items():
-        if col != 'prompt':  # Skip the prompt column itself
-            prompt += f"- {col}: {value}\n"
-    
-    prompt += "\nPlease analyze this data and provide insights."
-    
-    return prompt
+    # One "- column: value" line per column (except the prompt column itself),
+    # built as whole-column string operations instead of a Python loop per row.
+    # Values go through object so missing ones print as they would in an f-string
+    lines = [
+        "- " + str(col) + ": " + df[col].astype(object).map(str) + "\n"
+        for col in df.columns
+        if col != 'prompt'
+    ]
+    return reduce(operator.add, lines, pd.Series(PROMPT_HEADER, index=df.index, dtype=object)) + PROMPT_FOOTER
 
 def generate_prompts(df: pd.DataFrame) -> Optional[pd.DataFrame]:
     """
     Add a 'prompt' column to the DataFrame by creating a prompt for each row.
     
     This function:
-    1. Makes a copy of the input DataFrame
-    2. Creates a prompt for each row using the create_prompt function
+    1. Makes a shallow copy of the input DataFrame
+    2. Creates a prompt for each row using the create_prompts function
     3. Returns the DataFrame with the new 'prompt' column
     4. Returns None if there's an error
     
@@ -36,13 +41,14 @@ def generate_prompts(df: pd.DataFrame) -> Optional[pd.DataFrame]:
         A new DataFrame with an added 'prompt' column, or None if there's an error
     """
     try:
-        # Step 1: Make a copy of the original DataFrame to avoid changing it
+        # Step 1: Make a shallow copy so the new column doesn't change the original;
+        # the existing columns are only read, so their data isn't duplicated
         print(f"Making a copy of the DataFrame with {len(df)} rows")
-        df_copy = df.copy()
+        df_copy = df.copy(deep=False)
         
         # Step 2: Add a new column called 'prompt' to our copy
         print("Creating prompts for each row...")
-        df_copy['prompt'] = df_copy.apply(create_prompt, axis=1)
+        df_copy['prompt'] = create_prompts(df_copy)
         
         # Step 3: Return the DataFrame with the new column
         print(f"Successfully created {len(df_copy)} prompts!")
@@ -1,7 +1,7 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import date
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 class VerificationStatus(str, Enum):
     VERIFIED = "VERIFIED"
@@ -14,6 +14,9 @@ class SourceReliability(BaseModel):
     verification_status: VerificationStatus
 
 class FundingAnnouncement(BaseModel):
+    # CSV columns the model doesn't declare (e.g. standardised_round) are dropped
+    model_config = ConfigDict(extra='ignore')
+
     id: str
     company_name: str
     company_url: str
@@ -24,6 +27,11 @@ class FundingAnnouncement(BaseModel):
     investors: Optional[str]
     news_link: Optional[str]
 
+    @classmethod
+    def validate_batch(cls, records: List[Dict[str, Any]]) -> List['FundingAnnouncement']:
+        """Validate many records in one pydantic-core call."""
+        return _ANNOUNCEMENTS_ADAPTER.validate_python(records)
+
 class Discrepancy(BaseModel):
     field: str
     reported_value: str
@@ -31,6 +39,8 @@ class Discrepancy(BaseModel):
     impact: float
 
 class VerificationResult(BaseModel):
+    model_config = ConfigDict(extra='ignore')
+
     company_name: str
     verification_status: VerificationStatus
     overall_confidence: float
@@ -47,4 +57,13 @@ class VerificationResult(BaseModel):
         base_confidence = self.source_reliability.score
         discrepancy_penalty = sum(d.impact for d in self.discrepancies)
         
-        return max(0.0, min(1.0, base_confidence - discrepancy_penalty)) 
\ No newline at end of file
+        return max(0.0, min(1.0, base_confidence - discrepancy_penalty))
+
+    @classmethod
+    def dump_batch(cls, results: List['VerificationResult']) -> List[Dict[str, Any]]:
+        """JSON-mode dicts of many results in one pydantic-core call."""
+        return _RESULTS_ADAPTER.dump_python(results, mode='json')
+
+# Built once; validating or dumping a whole list runs in a single pydantic-core call
+_ANNOUNCEMENTS_ADAPTER = TypeAdapter(List[FundingAnnouncement])
+_RESULTS_ADAPTER = TypeAdapter(List[VerificationResult]) 
\ No newline at end of file
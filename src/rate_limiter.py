@@ -0,0 +1,137 @@
+import asyncio
+import re
+import time
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+
+_DURATION_RX = re.compile(r'(\d+(?:\.\d+)?)(ms|s|m|h)')
+_DURATION_UNITS = {'ms': 0.001, 's': 1.0, 'm': 60.0, 'h': 3600.0}
+
+# Longest a single retry will wait, whatever the server asks for
+MAX_RETRY_WAIT = 60.0
+
+
+def parse_reset_duration(value: Optional[str]) -> Optional[float]:
+    """Parse an OpenAI reset duration such as '6m0s', '1.5s' or '20ms' into seconds."""
+    if not value:
+        return None
+    matches = _DURATION_RX.findall(value)
+    if not matches:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in matches)
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> Optional[float]:
+    """Seconds the server asked us to wait, from Retry-After or the x-ratelimit-reset-* headers."""
+    retry_after_ms = headers.get('retry-after-ms')
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+
+    retry_after = headers.get('retry-after')
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+
+    resets = [
+        parse_reset_duration(headers.get(f'x-ratelimit-reset-{kind}'))
+        for kind in ('requests', 'tokens')
+    ]
+    resets = [reset for reset in resets if reset is not None]
+    return max(resets) if resets else None
+
+
+def wait_retry_after(retry_state) -> float:
+    """tenacity wait that honours the failed response's reset headers, else backs off exponentially."""
+    exc = retry_state.outcome.exception()
+    # Some errors carry headers directly, httpx and OpenAI errors via their response
+    headers = getattr(exc, 'headers', None)
+    if headers is None:
+        headers = getattr(getattr(exc, 'response', None), 'headers', None)
+
+    delay = retry_after_seconds(headers) if headers else None
+    if delay is None:
+        delay = min(10, 2 ** retry_state.attempt_number)
+    return min(delay, MAX_RETRY_WAIT)
+
+
+class TokenBucket:
+    """Proactive rate limiter tracking OpenAI request and token capacity.
+
+    Capacity refills continuously at ``rpm``/``tpm`` per minute and is corrected
+    from the ``x-ratelimit-*`` headers of every response, so requests are only
+    delayed when the account's actual rate limit requires it.
+    """
+
+    def __init__(self, rpm: float = 500, tpm: float = 30000):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.available_request_capacity = float(rpm)
+        self.available_token_capacity = float(tpm)
+        self._blocked_until = 0.0
+        self._last_update = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the capacity regained since the last update."""
+        now = time.monotonic()
+        elapsed = now - self._last_update
+        self._last_update = now
+        self.available_request_capacity = min(
+            self.rpm, self.available_request_capacity + self.rpm * elapsed / 60
+        )
+        self.available_token_capacity = min(
+            self.tpm, self.available_token_capacity + self.tpm * elapsed / 60
+        )
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until one request of ``tokens`` tokens fits in the bucket, then consume it."""
+        # A single request larger than the whole bucket would otherwise never fit
+        tokens = min(tokens, self.tpm)
+        async with self._lock:
+            while True:
+                self._refill()
+                blocked_for = self._blocked_until - time.monotonic()
+                if (blocked_for <= 0
+                        and self.available_request_capacity >= 1
+                        and self.available_token_capacity >= tokens):
+                    self.available_request_capacity -= 1
+                    self.available_token_capacity -= tokens
+                    return
+
+                request_wait = (1 - self.available_request_capacity) * 60 / self.rpm
+                token_wait = (tokens - self.available_token_capacity) * 60 / self.tpm
+                await asyncio.sleep(max(blocked_for, request_wait, token_wait, 0.01))
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Sync limits and remaining capacity with the server's rate-limit headers."""
+        self._refill()
+
+        limit_requests = headers.get('x-ratelimit-limit-requests')
+        limit_tokens = headers.get('x-ratelimit-limit-tokens')
+        if limit_requests:
+            self.rpm = float(limit_requests)
+        if limit_tokens:
+            self.tpm = float(limit_tokens)
+
+        for kind in ('requests', 'tokens'):
+            remaining = headers.get(f'x-ratelimit-remaining-{kind}')
+            if remaining is None:
+                continue
+            remaining = float(remaining)
+            if kind == 'requests':
+                self.available_request_capacity = min(self.available_request_capacity, remaining)
+            else:
+                self.available_token_capacity = min(self.available_token_capacity, remaining)
+
+            # Exhausted: hold every request until the server says the window resets
+            reset = parse_reset_duration(headers.get(f'x-ratelimit-reset-{kind}'))
+            if remaining <= 0 and reset:
+                self._blocked_until = max(self._blocked_until, time.monotonic() + reset)
@@ -1,9 +1,10 @@
+import numpy as np
 import pandas as pd
-import json
+import orjson
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from enum import Enum
 
 class VerificationStatus(Enum):
@@ -11,111 +12,120 @@ class VerificationStatus(Enum):
     UNVERIFIED = "Unverified"
     INCONCLUSIVE = "Inconclusive"
 
-def load_verification_data(reports_dir: str = "reports") -> List[Dict]:
-    """Load all verification data from JSON files in the reports directory."""
-    verification_data = []
-    for file in Path(reports_dir).glob("*_data.json"):
-        with open(file, "r") as f:
-            data = json.load(f)
-            verification_data.append(data)
-    return verification_data
+# Flat columns of the nested report sections, one value per column rather than a dict per cell
+SOURCE_RELIABILITY_FIELDS = ["domain", "is_verified_publisher", "has_https", "domain_age_score", "content_quality_score"]
+DETAIL_FIELDS = ["amount", "round_type", "date"]
+CONFIDENCE_SCORE_FIELDS = [
+    "source_reliability", "data_completeness", "data_consistency", "extraction_quality", "discrepancy_impact"
+]
+SOURCE_RELIABILITY_COLUMNS = [f"sr_{field}" for field in SOURCE_RELIABILITY_FIELDS]
+CONFIDENCE_SCORE_COLUMNS = [f"cs_{field}" for field in CONFIDENCE_SCORE_FIELDS]
 
-def create_detailed_dataframe(verification_data: List[Dict]) -> pd.DataFrame:
-    """Create a detailed DataFrame from verification data."""
-    records = []
+def _to_record(data: Dict) -> Dict:
+    """Build the flat report record of one verification's JSON data, without its status."""
+    source_reliability = data["source_reliability"]
+    reported = data["reported_details"]
+    extracted = data["extracted_details"]
+    confidence_scores = data["confidence_scores"]
     
-    for data in verification_data:
-        # Determine verification status based on confidence and discrepancies
-        confidence = data["overall_confidence"]
-        num_discrepancies = len(data["discrepancies"])
-        
-        if confidence >= 0.8 and num_discrepancies == 0:
-            status = VerificationStatus.VERIFIED.value
-        elif confidence < 0.5 or num_discrepancies > 2:
-            status = VerificationStatus.UNVERIFIED.value
-        else:
-            status = VerificationStatus.INCONCLUSIVE.value
+    record = {
+        "company_name": data["company_name"],
+        "verification_id": data["verification_id"],
+        "timestamp": data["timestamp"],
+        "overall_confidence": data["overall_confidence"],
+        "source_url": data["source_url"]
+    }
+    # Supporting Evidence
+    for field in SOURCE_RELIABILITY_FIELDS:
+        record[f"sr_{field}"] = source_reliability[field]
+    # Reported vs Extracted Details
+    for field in DETAIL_FIELDS:
+        record[f"reported_{field}"] = reported[field]
+        record[f"extracted_{field}"] = extracted[field]
+    # Confidence Scores
+    for field in CONFIDENCE_SCORE_FIELDS:
+        record[f"cs_{field}"] = confidence_scores[field]
+    # Discrepancies
+    record["discrepancy_count"] = len(data["discrepancies"])
+    record["discrepancies"] = data["discrepancies"]
+    return record
+
+def _iter_records(reports_dir: str) -> Iterator[Dict]:
+    """Yield the record of each verification JSON file in the reports directory, one file at a time."""
+    for file in Path(reports_dir).glob("*_data.json"):
+        with open(file, "rb") as f:
+            yield _to_record(orjson.loads(f.read()))
 
-        record = {
-            "company_name": data["company_name"],
-            "verification_id": data["verification_id"],
-            "timestamp": data["timestamp"],
-            "verification_status": status,
-            "overall_confidence": data["overall_confidence"],
-            "source_url": data["source_url"],
-            
-            # Supporting Evidence
-            "source_reliability": {
-                "domain": data["source_reliability"]["domain"],
-                "is_verified_publisher": data["source_reliability"]["is_verified_publisher"],
-                "has_https": data["source_reliability"]["has_https"],
-                "domain_age_score": data["source_reliability"]["domain_age_score"],
-                "content_quality_score": data["source_reliability"]["content_quality_score"]
-            },
-            
-            # Reported vs Extracted Details
-            "reported_details": {
-                "amount": data["reported_details"]["amount"],
-                "round_type": data["reported_details"]["round_type"],
-                "date": data["reported_details"]["date"]
-            },
-            "extracted_details": {
-                "amount": data["extracted_details"]["amount"],
-                "round_type": data["extracted_details"]["round_type"],
-                "date": data["extracted_details"]["date"]
-            },
-            
-            # Confidence Scores
-            "confidence_scores": {
-                "source_reliability": data["confidence_scores"]["source_reliability"],
-                "data_completeness": data["confidence_scores"]["data_completeness"],
-                "data_consistency": data["confidence_scores"]["data_consistency"],
-                "extraction_quality": data["confidence_scores"]["extraction_quality"],
-                "discrepancy_impact": data["confidence_scores"]["discrepancy_impact"]
-            },
-            
-            # Discrepancies
-            "discrepancies": data["discrepancies"]
-        }
-        records.append(record)
+def load_detailed_dataframe(reports_dir: str = "reports") -> pd.DataFrame:
+    """Create a detailed DataFrame from the verification data in the reports directory.
+
+    Each file is parsed and turned into its record in one pass, so the raw
+    JSON of every report is never held at once.
+    """
+    df = pd.DataFrame.from_records(_iter_records(reports_dir))
+    if df.empty:
+        return df
     
-    return pd.DataFrame(records)
+    # Determine verification status based on confidence and discrepancies, for all rows at once
+    confidence = df['overall_confidence'].to_numpy()
+    num_discrepancies = df['discrepancy_count'].to_numpy()
+    status = np.select(
+        [
+            (confidence >= 0.8) & (num_discrepancies == 0),
+            (confidence < 0.5) | (num_discrepancies > 2)
+        ],
+        [VerificationStatus.VERIFIED.value, VerificationStatus.UNVERIFIED.value],
+        default=VerificationStatus.INCONCLUSIVE.value
+    )
+    df.insert(df.columns.get_loc('timestamp') + 1, 'verification_status', status)
+    return df
 
 def generate_excel_report(df: pd.DataFrame, output_path: str = "reports/verification_results.xlsx"):
     """Generate an Excel report with multiple sheets for different views of the data."""
-    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+    # Derived text columns are computed from the flat columns before the workbook is opened
+    source_reliability_str = (
+        "Domain: " + df['sr_domain'].astype(str)
+        + "\nVerified Publisher: " + df['sr_is_verified_publisher'].astype(str)
+        + "\nContent Quality: " + df['sr_content_quality_score'].map('{:.2f}'.format)
+    )
+    confidence_scores_str = (
+        "Source Reliability: " + df['cs_source_reliability'].map('{:.2f}'.format)
+        + "\nData Completeness: " + df['cs_data_completeness'].map('{:.2f}'.format)
+        + "\nConsistency: " + df['cs_data_consistency'].map('{:.2f}'.format)
+    )
+    discrepancy_details = df['discrepancies'].map(
+        lambda x: "\n".join([f"- {d['field']}: {d['reported_value']} vs {d['extracted_value']} (Severity: {d['severity']})"
+                             for d in x])
+    )
+    
+    # xlsxwriter serialises sheets faster and with less memory than openpyxl
+    with pd.ExcelWriter(output_path, engine='xlsxwriter') as writer:
         # Summary sheet with verification status
         summary_df = df.groupby('verification_status').agg({
             'overall_confidence': ['count', 'mean'],
-            'source_reliability': lambda x: x.apply(lambda y: y['content_quality_score']).mean()
+            'sr_content_quality_score': 'mean'
         }).round(2)
         summary_df.columns = ['Number of Cases', 'Average Confidence', 'Average Source Quality']
         summary_df.to_excel(writer, sheet_name='Verification Summary')
         
         # Detailed results with supporting evidence
-        detailed_df = df.copy()
-        detailed_df['source_reliability'] = detailed_df['source_reliability'].apply(
-            lambda x: f"Domain: {x['domain']}\nVerified Publisher: {x['is_verified_publisher']}\nContent Quality: {x['content_quality_score']:.2f}"
-        )
-        detailed_df['confidence_scores'] = detailed_df['confidence_scores'].apply(
-            lambda x: f"Source Reliability: {x['source_reliability']:.2f}\nData Completeness: {x['data_completeness']:.2f}\nConsistency: {x['data_consistency']:.2f}"
+        detailed_df = df.drop(columns=SOURCE_RELIABILITY_COLUMNS + CONFIDENCE_SCORE_COLUMNS).assign(
+            source_reliability=source_reliability_str,
+            confidence_scores=confidence_scores_str
         )
         detailed_df.to_excel(writer, sheet_name='Detailed Results', index=False)
         
         # Discrepancies analysis
-        discrepancies_df = df[['company_name', 'verification_status', 'discrepancies']]
-        discrepancies_df['discrepancy_count'] = discrepancies_df['discrepancies'].apply(len)
-        discrepancies_df['discrepancy_details'] = discrepancies_df['discrepancies'].apply(
-            lambda x: "\n".join(f"- {d['field']}: {d['reported_value']} vs {d['extracted_value']} (Severity: {d['severity']})"
-                              for d in x)
+        discrepancies_df = df[['company_name', 'verification_status', 'discrepancies', 'discrepancy_count']].assign(
+            discrepancy_details=discrepancy_details
         )
         discrepancies_df.to_excel(writer, sheet_name='Discrepancies', index=False)
         
         # Confidence metrics
-        confidence_metrics = df[[
-            'company_name', 'verification_status', 'overall_confidence',
-            'source_reliability', 'confidence_scores'
-        ]]
+        confidence_metrics = df[
+            ['company_name', 'verification_status', 'overall_confidence']
+            + SOURCE_RELIABILITY_COLUMNS + CONFIDENCE_SCORE_COLUMNS
+        ]
         confidence_metrics.to_excel(writer, sheet_name='Confidence Analysis', index=False)
 
 def generate_reports():
@@ -123,16 +133,13 @@ def generate_reports():
     # Create reports directory if it doesn't exist
     os.makedirs("reports", exist_ok=True)
     
-    # Load verification data
-    verification_data = load_verification_data()
+    # Load verification data into the detailed DataFrame
+    df = load_detailed_dataframe()
     
-    if not verification_data:
+    if df.empty:
         print("No verification data found in the reports directory.")
         return
     
-    # Create detailed DataFrame
-    df = create_detailed_dataframe(verification_data)
-    
     # Save to CSV
     df.to_csv("reports/verification_detailed.csv", index=False)
     
@@ -148,7 +155,7 @@ def generate_reports():
     for status, count in status_counts.items():
         print(f"- {status}: {count} ({count/len(df)*100:.1f}%)")
     print(f"\nAverage Confidence: {df['overall_confidence'].mean():.2f}")
-    print(f"Total Discrepancies: {df['discrepancies'].apply(len).sum()}")
+    print(f"Total Discrepancies: {df['discrepancy_count'].sum()}")
     print("\nReports generated:")
     print("1. reports/verification_detailed.csv")
     print("2. reports/verification_results.xlsx")
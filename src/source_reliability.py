@@ -1,85 +1,88 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 from typing import Optional, List
 from datetime import datetime
 import tldextract
 import re
-from dataclasses import dataclass
+from types import MappingProxyType
+from functools import cached_property, lru_cache
 
-@dataclass
-class SourceReliability:
-    """Class for storing source reliability metrics."""
-    domain: str
-    is_verified_publisher: bool
-    has_https: bool
-    domain_age_score: float
-    content_quality_score: float
-    reliability_score: float
+# Reputation score of well-known news domains (simplified), read-only
+REPUTABLE_DOMAINS = MappingProxyType({
+    'techcrunch.com': 0.9,
+    'reuters.com': 1.0,
+    'bloomberg.com': 1.0,
+    'wsj.com': 1.0,
+    'ft.com': 1.0,
+    'cnbc.com': 0.9,
+    'venturebeat.com': 0.8,
+    'crunchbase.com': 0.85
+})
+_REPUTABLE_SET = frozenset(REPUTABLE_DOMAINS)
 
-class SourceReliability(BaseModel):
+# Content quality patterns, compiled once at import
+_AMOUNT_RE = re.compile(r'\$\d+(?:\.\d+)?[MBmb]')
+_ROUND_RE = re.compile(r'(?:Series|Seed|Round)')
+_VERB_RE = re.compile(r'\b(?:announced|secured|raised|closed)\b')
+_SPAM_RE = re.compile(r'(?:click here|buy now|advertisement)')
+
+# (pattern, whether a match is a good sign) for each pattern-based quality indicator
+_QUALITY_CHECKS = (
+    (_AMOUNT_RE, True),  # Contains funding amount
+    (_ROUND_RE, True),  # Contains round information
+    (_VERB_RE, True),  # Contains funding verbs
+    (_SPAM_RE, False)  # No spam indicators
+)
+
+@lru_cache(maxsize=4096)
+def _extract_domain(url: str) -> str:
+    """Registered domain of a URL (e.g. news.bbc.co.uk -> bbc.co.uk), memoised per URL."""
+    ext = tldextract.extract(url)
+    return f"{ext.domain}.{ext.suffix}"
+
+class SourceReliabilityModel(BaseModel):
     """Model for evaluating the reliability of a news source."""
+    # Frozen so the cached reliability score can't go stale
+    model_config = ConfigDict(frozen=True)
+
     domain: str = Field(description="The domain name of the news source")
     is_verified_publisher: bool = Field(description="Whether the source is a verified news publisher")
     has_https: bool = Field(description="Whether the source uses HTTPS")
     domain_age_score: float = Field(description="Score based on domain age and reputation")
     content_quality_score: float = Field(description="Score based on content quality indicators")
     
-    @property
+    @computed_field
+    @cached_property
     def reliability_score(self) -> float:
         """Calculate overall reliability score."""
-        score = 1.0
-        
-        # Base reliability from domain reputation
-        score *= self.domain_age_score
-        
-        # Verified publisher bonus
-        if self.is_verified_publisher:
-            score *= 1.2
-            
-        # HTTPS security bonus
-        if self.has_https:
-            score *= 1.1
-            
-        # Content quality impact
-        score *= self.content_quality_score
-        
-        return min(1.0, score)
+        # Domain reputation times content quality, with a 20% bonus for verified
+        # publishers and 10% for HTTPS (booleans count as 0/1)
+        return min(
+            1.0,
+            self.domain_age_score * self.content_quality_score
+            * (1.0 + 0.2 * self.is_verified_publisher) * (1.0 + 0.1 * self.has_https)
+        )
 
     @classmethod
-    def evaluate_source(cls, url: str, content: str) -> 'SourceReliability':
+    def evaluate_source(cls, url: str, content: str) -> 'SourceReliabilityModel':
         """Evaluate a news source based on URL and content."""
         # Extract domain
-        ext = tldextract.extract(url)
-        domain = f"{ext.domain}.{ext.suffix}"
+        domain = _extract_domain(url)
         
         # Check HTTPS
         has_https = url.startswith('https://')
         
-        # Evaluate domain reputation (simplified)
-        reputable_domains = {
-            'techcrunch.com': 0.9,
-            'reuters.com': 1.0,
-            'bloomberg.com': 1.0,
-            'wsj.com': 1.0,
-            'ft.com': 1.0,
-            'cnbc.com': 0.9,
-            'venturebeat.com': 0.8,
-            'crunchbase.com': 0.85
-        }
-        domain_score = reputable_domains.get(domain, 0.6)
+        # Evaluate domain reputation
+        domain_score = REPUTABLE_DOMAINS.get(domain, 0.6)
         
         # Content quality checks
-        quality_indicators = [
-            len(content) > 200,  # Minimum length
-            bool(re.search(r'\$\d+(?:\.\d+)?[MBmb]', content)),  # Contains funding amount
-            bool(re.search(r'(?:Series|Seed|Round)', content)),  # Contains round information
-            bool(re.search(r'\b(?:announced|secured|raised|closed)\b', content)),  # Contains funding verbs
-            not bool(re.search(r'(?:click here|buy now|advertisement)', content))  # No spam indicators
-        ]
-        content_score = sum(1 for x in quality_indicators if x) / len(quality_indicators)
+        hits = len(content) > 200  # Minimum length
+        for pattern, wanted in _QUALITY_CHECKS:
+            hits += (pattern.search(content) is not None) == wanted
+        content_score = hits / (len(_QUALITY_CHECKS) + 1)
         
         return cls(
             domain=domain,
-            is_verified_publisher=domain in reputable_domains,
+            is_verified_publisher=domain in _REPUTABLE_SET,
             has_https=has_https,
             domain_age_score=domain_score,
             content_quality_score=content_score
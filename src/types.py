@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 from typing import Optional, Dict, Any, List
+import orjson
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedDetails:
     """Details extracted from funding announcement content."""
     company_name: str
@@ -11,7 +12,7 @@ class ExtractedDetails:
     investors: Optional[List[str]] = None
     description: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class SourceReliability:
     """Assessment of source reliability."""
     domain: str
@@ -20,7 +21,8 @@ class SourceReliability:
     content_quality_score: float
     overall_score: float
 
-@dataclass
+# Frozen: the comparison cache hands the same instances to every result
+@dataclass(slots=True, frozen=True)
 class Discrepancy:
     """Represents a discrepancy between reported and extracted details."""
     field: str
@@ -28,7 +30,7 @@ class Discrepancy:
     extracted_value: Any
     impact: float  # Impact score between 0 and 1
 
-@dataclass
+@dataclass(slots=True)
 class VerificationResult:
     """Result of funding announcement verification."""
     company_name: str
@@ -39,4 +41,8 @@ class VerificationResult:
     reported_details: Dict[str, Any]
     extracted_details: ExtractedDetails
     discrepancies: List[Discrepancy]
-    verification_notes: str 
\ No newline at end of file
+    verification_notes: str
+
+    def to_json_bytes(self) -> bytes:
+        """JSON of the result, serialised by orjson straight from the dataclasses."""
+        return orjson.dumps(self, default=str) 
\ No newline at end of file
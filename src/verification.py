@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from typing import Dict, Optional
 from .data_operations import load_csv
@@ -12,19 +13,24 @@ def analyze_funding_data(file_path: str) -> Optional[pd.DataFrame]:
     if df is None:
         return None
     
-    # Categorize entries
-    df['verification_category'] = 'needs_verification'
-    df.loc[~df['News link'].isna(), 'verification_category'] = 'has_news_link'
+    # Categorize entries in one column write, reusing the mask for the counts below
+    has_link = df['News link'].notna().to_numpy()
+    df['verification_category'] = np.where(has_link, 'has_news_link', 'needs_verification')
+    link_count = int(has_link.sum())
     
-    # Print summary
+    # Print summary, counted from the mask rather than a value_counts pass
+    category_counts = pd.Series(
+        {'has_news_link': link_count, 'needs_verification': len(has_link) - link_count},
+        name='count'
+    ).rename_axis('verification_category')
     print("\n=== Verification Categories ===")
-    print(df['verification_category'].value_counts())
+    print(category_counts[category_counts > 0].sort_values(ascending=False, kind='stable'))
     
     # Basic validation checks
     print("\n=== Data Validation ===")
     print(f"Total entries: {len(df)}")
-    print(f"Entries with news links: {(~df['News link'].isna()).sum()}")
-    print(f"Entries needing web search: {df['News link'].isna().sum()}")
+    print(f"Entries with news links: {link_count}")
+    print(f"Entries needing web search: {len(has_link) - link_count}")
     
     return df
 
@@ -0,0 +1,46 @@
+import operator
+import sys
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+from .types import Discrepancy, ExtractedDetails
+
+# Entries kept per cache; the least recently used are evicted first
+CACHE_SIZE = 4096
+
+def find_discrepancies(reported: Dict[str, Any], extracted: ExtractedDetails) -> List[Discrepancy]:
+    """Discrepancies between reported and extracted details, memoised per pair of values."""
+    return list(_compare_details(
+        (reported['company'], reported['amount'], reported['round_type'], reported['date']),
+        (extracted.company_name, extracted.amount, extracted.round_type, extracted.date)
+    ))
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _fold(value: str) -> str:
+    """Interned lowercase form; the same few company and round names recur across batches."""
+    return sys.intern(value.lower())
+
+def _differs_ignoring_case(reported: str, extracted: str) -> bool:
+    # Interned, so equal folded strings are the same object
+    return _fold(reported) is not _fold(extracted)
+
+def _amount_differs(reported: float, extracted: float) -> bool:
+    """More than 5% apart, relative to the reported amount (any change counts if it was 0)."""
+    return abs(reported - extracted) > 0.05 * abs(reported)
+
+# (field, impact, comparator) in the order of the detail tuples
+_RULES = (
+    ('company', 0.8, _differs_ignoring_case),  # High impact
+    ('amount', 0.6, _amount_differs),  # Medium-high impact
+    ('round_type', 0.4, _differs_ignoring_case),  # Medium impact
+    ('date', 0.3, operator.ne)  # Medium-low impact
+)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _compare_details(reported: Tuple, extracted: Tuple) -> Tuple[Discrepancy, ...]:
+    """Compare (company, amount, round_type, date) tuples field by field."""
+    return tuple(
+        Discrepancy(field=field, reported_value=reported_value, extracted_value=extracted_value, impact=impact)
+        for (field, impact, differs), reported_value, extracted_value in zip(_RULES, reported, extracted)
+        if differs(reported_value, extracted_value)
+    )
@@ -1,17 +1,23 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict
-from datetime import datetime
-from .models import FundingDetails, SourceReliability, Discrepancy
-from .source_reliability import SourceReliability
-from dataclasses import dataclass, asdict
-
-class DiscrepancyDetail(BaseModel):
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterator, Optional, List, Dict
+import time
+from .models import _ensure_directory, _json_default
+from dataclasses import dataclass
+import orjson
+
+if TYPE_CHECKING:
+    # Only used in annotations
+    from .models import FundingDetails, SourceReliability, Discrepancy
+
+@dataclass(slots=True, frozen=True)
+class DiscrepancyDetail:
     """Details about a discrepancy between reported and extracted information."""
-    field: str = Field(description="The field where the discrepancy was found")
-    reported_value: str = Field(description="The value as reported")
-    extracted_value: str = Field(description="The value as extracted")
-    severity: float = Field(description="Severity score of the discrepancy (0-1)")
-    impact: str = Field(description="Description of the impact of this discrepancy")
+    field: str  # The field where the discrepancy was found
+    reported_value: str  # The value as reported
+    extracted_value: str  # The value as extracted
+    severity: float  # Severity score of the discrepancy (0-1)
+    impact: str  # Description of the impact of this discrepancy
 
 @dataclass
 class VerificationReport:
@@ -27,60 +33,53 @@ class VerificationReport:
     overall_confidence: float
     verification_status: str
     
-    def model_dump(self) -> Dict:
-        """Convert the report to a dictionary."""
-        return {
-            'verification_id': self.verification_id,
-            'timestamp': self.timestamp,
-            'company_name': self.company_name,
-            'source_url': self.source_url,
-            'source_reliability': asdict(self.source_reliability),
-            'reported_details': asdict(self.reported_details),
-            'extracted_details': asdict(self.extracted_details),
-            'discrepancies': [asdict(d) for d in self.discrepancies],
-            'confidence_scores': self.confidence_scores,
-            'overall_confidence': self.overall_confidence,
-            'verification_status': self.verification_status
-        }
-    
     def generate_summary(self) -> str:
         """Generate a human-readable summary of the verification results."""
-        summary = [
-            f"Verification Report for {self.company_name}",
-            f"ID: {self.verification_id}",
-            f"Status: {self.verification_status}",
-            f"Overall Confidence: {self.overall_confidence:.2f}",
-            "",
-            "Source Assessment:",
-            f"- URL: {self.source_url}",
-            f"- Domain: {self.source_reliability.domain}",
-            f"- Verified Publisher: {'Yes' if self.source_reliability.is_verified_publisher else 'No'}",
-            f"- Reliability Score: {self.source_reliability.reliability_score:.2f}",
-            "",
-            "Reported Details:",
-            f"- Amount: ${self.reported_details.amount}M",
-            f"- Round: {self.reported_details.round_type}",
-            f"- Date: {self.reported_details.date}",
-            "",
-            "Extracted Details:",
-            f"- Amount: ${self.extracted_details.amount}M",
-            f"- Round: {self.extracted_details.round_type}",
-            f"- Date: {self.extracted_details.date}",
-            "",
-            f"Discrepancies Found: {len(self.discrepancies)}",
-        ]
+        sr = self.source_reliability
+        rd = self.reported_details
+        ed = self.extracted_details
+        summary = f"""Verification Report for {self.company_name}
+ID: {self.verification_id}
+Status: {self.verification_status}
+Overall Confidence: {self.overall_confidence:.2f}
+
+Source Assessment:
+- URL: {self.source_url}
+- Domain: {sr.domain}
+- Verified Publisher: {'Yes' if sr.is_verified_publisher else 'No'}
+- Reliability Score: {sr.reliability_score:.2f}
+
+Reported Details:
+- Amount: ${rd.amount}M
+- Round: {rd.round_type}
+- Date: {rd.date}
+
+Extracted Details:
+- Amount: ${ed.amount}M
+- Round: {ed.round_type}
+- Date: {ed.date}
+
+Discrepancies Found: {len(self.discrepancies)}"""
         
         if self.discrepancies:
-            summary.append("Discrepancy Details:")
-            for d in self.discrepancies:
-                summary.append(f"- {d.field}: {d.reported_value} vs {d.extracted_value}")
-                summary.append(f"  Severity: {d.severity:.2f}, Impact: {d.impact}")
+            details = "\n".join([
+                f"- {d.field}: {d.reported_value} vs {d.extracted_value}\n  Severity: {d.severity:.2f}, Impact: {d.impact}"
+                for d in self.discrepancies
+            ])
+            summary = f"{summary}\nDiscrepancy Details:\n{details}"
         
-        return "\n".join(summary)
+        return summary
 
     def generate_detailed_report(self) -> str:
         """Generate a detailed human-readable report."""
-        return f"""
+        return "".join(self._iter_report_parts())
+
+    def _iter_report_parts(self) -> Iterator[str]:
+        """The detailed report in pieces, one per discrepancy, so it can be written out as it's built."""
+        sr = self.source_reliability
+        rd = self.reported_details
+        ed = self.extracted_details
+        yield f"""
 FUNDING ANNOUNCEMENT VERIFICATION REPORT
 ======================================
 Verification ID: {self.verification_id}
@@ -93,25 +92,27 @@ Company: {self.company_name}
 SOURCE ASSESSMENT
 ----------------
 Source: {self.source_url}
-Reliability Score: {self.source_reliability.reliability_score:.2f}
-Domain Reputation: {self.source_reliability.domain_age_score:.2f}
-Content Quality: {self.source_reliability.content_quality_score:.2f}
+Reliability Score: {sr.reliability_score:.2f}
+Domain Reputation: {sr.domain_age_score:.2f}
+Content Quality: {sr.content_quality_score:.2f}
 
 FUNDING DETAILS COMPARISON
 ------------------------
 Reported Details:
-- Amount: ${self.reported_details.amount}M
-- Round: {self.reported_details.round_type or 'Not specified'}
-- Date: {self.reported_details.date or 'Not specified'}
+- Amount: ${rd.amount}M
+- Round: {rd.round_type or 'Not specified'}
+- Date: {rd.date or 'Not specified'}
 
 Extracted Details:
-- Amount: ${self.extracted_details.amount}M
-- Round: {self.extracted_details.round_type or 'Not specified'}
-- Date: {self.extracted_details.date or 'Not specified'}
+- Amount: ${ed.amount}M
+- Round: {ed.round_type or 'Not specified'}
+- Date: {ed.date or 'Not specified'}
 
 DISCREPANCIES FOUND
 ------------------
-{self._format_discrepancies()}
+"""
+        yield from self._iter_discrepancies()
+        yield f"""
 
 CONFIDENCE ASSESSMENT
 -------------------
@@ -124,18 +125,19 @@ VERIFICATION RESULT
 Status: {self.verification_status.upper()}
 
 Additional Notes:
-- Source is {'' if self.source_reliability.is_verified_publisher else 'not '}a verified publisher
-- Content quality indicators: {self.source_reliability.content_quality_score:.2f}/1.0
+- Source is {'' if sr.is_verified_publisher else 'not '}a verified publisher
+- Content quality indicators: {sr.content_quality_score:.2f}/1.0
 """
 
-    def _format_discrepancies(self) -> str:
+    def _iter_discrepancies(self) -> Iterator[str]:
         if not self.discrepancies:
-            return "No discrepancies found."
+            yield "No discrepancies found."
+            return
         
-        return "\n".join(
-            f"- {d.field}: {d.reported_value} (reported) vs {d.extracted_value} (extracted)\n  Severity: {d.severity:.2f}\n  Impact: {d.impact}"
-            for d in self.discrepancies
-        )
+        separator = ""
+        for d in self.discrepancies:
+            yield f"{separator}- {d.field}: {d.reported_value} (reported) vs {d.extracted_value} (extracted)\n  Severity: {d.severity:.2f}\n  Impact: {d.impact}"
+            separator = "\n"
 
     def _format_confidence_scores(self) -> str:
         return "\n".join(
@@ -145,22 +147,19 @@ Additional Notes:
 
     def save_to_file(self, directory: str = "reports") -> str:
         """Save the report to a file and return the filename."""
-        import os
-        import json
-        from datetime import datetime
-        
         # Create directory if it doesn't exist
-        os.makedirs(directory, exist_ok=True)
+        _ensure_directory(directory)
         
         # Generate filename
-        filename = f"{directory}/{self.company_name}_{self.verification_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        filename = f"{directory}/{self.company_name}_{self.verification_id}_{time.strftime('%Y%m%d_%H%M%S')}"
         
-        # Save detailed text report
-        with open(f"{filename}_report.txt", "w") as f:
-            f.write(self.generate_detailed_report())
+        # Save detailed text report, streamed into a 64 KiB write buffer
+        with open(f"{filename}_report.txt", "w", buffering=1 << 16) as f:
+            f.writelines(self._iter_report_parts())
             
-        # Save JSON data
-        with open(f"{filename}_data.json", "w") as f:
-            json.dump(self.model_dump(), f, indent=2, default=str)
+        # Save JSON data; orjson walks the report dataclass itself, so no
+        # intermediate dict is built
+        with open(f"{filename}_data.json", "wb") as f:
+            f.write(orjson.dumps(self, default=_json_default, option=orjson.OPT_INDENT_2))
             
         return filename 
\ No newline at end of file
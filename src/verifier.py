@@ -1,8 +1,73 @@
+import hashlib
 import logging
-from typing import Dict, Any, List
-import os
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
 from .types import ExtractedDetails, SourceReliability, Discrepancy, VerificationResult
+from .config import OPENAI_API_KEY
 from .content_analyzer import ContentAnalyzer
+from .verification_cache import find_discrepancies
+
+# Indexed by how many confidence thresholds a result clears
+_STATUSES = ('UNVERIFIED', 'PARTIALLY_VERIFIED', 'VERIFIED')
+
+# Verified results kept for repeated announcements; the least recently used are evicted first
+RESULT_CACHE_SIZE = 1024
+
+_RESULT_CACHE: 'OrderedDict[Tuple, VerificationResult]' = OrderedDict()
+
+def score_batch(
+    base_scores: np.ndarray,
+    impacts: np.ndarray,
+    offsets: np.ndarray,
+    verified_threshold: float,
+    partial_threshold: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Overall confidences and status codes (indexes into _STATUSES) for many results at once.
+
+    impacts holds every result's discrepancy impacts back to back; result i owns
+    impacts[offsets[i]:offsets[i + 1]]. Same arithmetic as
+    _calculate_confidence_scores and _determine_verification_status.
+    """
+    lengths = np.diff(offsets)
+    has_discrepancies = lengths > 0
+    worst = np.zeros(len(lengths))
+    # Empty segments are left out of reduceat, which would otherwise give them the next result's first impact
+    if has_discrepancies.any():
+        worst[has_discrepancies] = np.maximum.reduceat(impacts, offsets[:-1][has_discrepancies])
+    scores = base_scores * (1 - worst * 0.8)
+    statuses = (scores >= partial_threshold).astype(np.int8) + (scores >= verified_threshold)
+    return scores, statuses
+
+def _result_key(company: str, amount: float, round_type: str, date: str, source_url: str, content: str) -> Tuple:
+    """Cache key of a verification; the content is reduced to a digest so it isn't kept alive."""
+    digest = hashlib.blake2b(content.encode(), digest_size=16).digest()
+    return (company, amount, round_type, date, source_url, digest)
+
+def _cached_result(key: Tuple) -> Optional[VerificationResult]:
+    """Copy of the cached result for key, or None."""
+    cached = _RESULT_CACHE.get(key)
+    if cached is None:
+        return None
+    _RESULT_CACHE.move_to_end(key)
+    return _copy_result(cached)
+
+def _cache_result(key: Tuple, result: VerificationResult) -> None:
+    """Cache a copy of result under key, evicting the least recently used entry when full."""
+    _RESULT_CACHE[key] = _copy_result(result)
+    if len(_RESULT_CACHE) > RESULT_CACHE_SIZE:
+        _RESULT_CACHE.popitem(last=False)
+
+def _copy_result(result: VerificationResult) -> VerificationResult:
+    """Copy of a result that shares no mutable parts with it (discrepancies themselves are frozen)."""
+    return replace(
+        result,
+        source_reliability=replace(result.source_reliability),
+        reported_details=dict(result.reported_details),
+        extracted_details=replace(result.extracted_details),
+        discrepancies=list(result.discrepancies)
+    )
 
 class FundingVerifier:
     def __init__(self):
@@ -11,8 +76,19 @@ class FundingVerifier:
             'VERIFIED': 0.8,
             'PARTIALLY_VERIFIED': 0.5
         }
+        self._analyzer: Optional[ContentAnalyzer] = None
     
-    def verify_announcement(
+    @property
+    def analyzer(self) -> ContentAnalyzer:
+        """Content analyzer shared by every verification, created on first use.
+        
+        Keeping one analyzer keeps its LLM cache index loaded between calls.
+        """
+        if self._analyzer is None:
+            self._analyzer = ContentAnalyzer(api_key=OPENAI_API_KEY)
+        return self._analyzer
+    
+    async def verify_announcement(
         self,
         company: str,
         amount: float,
@@ -20,18 +96,102 @@ class FundingVerifier:
         date: str,
         source_url: str,
         content: str
-    ) -> Dict[str, Any]:
-        """Verify a funding announcement."""
+    ) -> VerificationResult:
+        """Verify a funding announcement, reusing the result of an identical earlier verification."""
         try:
-            # Create content analyzer instance
-            content_analyzer = ContentAnalyzer(api_key=os.getenv('OPENAI_API_KEY'))
+            key = _result_key(company, amount, round_type, date, source_url, content)
+            cached = _cached_result(key)
+            if cached is not None:
+                return cached
             
             # Extract details and assess reliability
-            extracted_details, source_reliability = content_analyzer.analyze_content(
+            extracted_details, source_reliability = await self.analyzer.analyze_content(
                 content=content,
                 source_url=source_url
             )
             
+            result = self._build_result(
+                company, amount, round_type, date, source_url,
+                extracted_details, source_reliability
+            )
+            _cache_result(key, result)
+            return result
+            
+        except Exception as e:
+            logging.error(f"Error verifying announcement: {str(e)}")
+            raise
+    
+    async def verify_announcements(self, announcements: List[Dict[str, Any]]) -> List[VerificationResult]:
+        """Verify many announcements, extracting their details in batched OpenAI calls.
+        
+        Each announcement is a dict with the keyword arguments of verify_announcement.
+        Announcements whose details could not be extracted are left out of the results,
+        and ones verified before are answered from the result cache.
+        """
+        try:
+            keys = [
+                _result_key(a['company'], a['amount'], a['round_type'], a['date'], a['source_url'], a['content'])
+                for a in announcements
+            ]
+            results = {}
+            for i, key in enumerate(keys):
+                cached = _cached_result(key)
+                if cached is not None:
+                    results[i] = cached
+            
+            # Identical announcements in one call are analyzed once, under their first index;
+            # the batches themselves already go out concurrently
+            pending = {}
+            for i, key in enumerate(keys):
+                if i not in results:
+                    pending.setdefault(key, i)
+            if pending:
+                analyses = await self.analyzer.analyze_contents([
+                    (str(i), announcements[i]['content'], announcements[i]['source_url']) for i in pending.values()
+                ])
+                
+                analyzed = [i for i in pending.values() if str(i) in analyses]
+                discrepancies = [
+                    self._find_discrepancies(
+                        reported={field: announcements[i][field] for field in ('company', 'amount', 'round_type', 'date')},
+                        extracted=analyses[str(i)][0]
+                    )
+                    for i in analyzed
+                ]
+                # The whole batch is scored in one pass over arrays
+                scores, statuses = self.score_results([analyses[str(i)][1] for i in analyzed], discrepancies)
+                for i, found, score, status in zip(analyzed, discrepancies, scores, statuses):
+                    a = announcements[i]
+                    extracted_details, source_reliability = analyses[str(i)]
+                    results[i] = self._assemble_result(
+                        a['company'], a['amount'], a['round_type'], a['date'], a['source_url'],
+                        extracted_details, source_reliability, found, score, status
+                    )
+                    _cache_result(keys[i], results[i])
+                
+                for i, key in enumerate(keys):
+                    first = pending.get(key)
+                    if i not in results and first in results:
+                        results[i] = _copy_result(results[first])
+            
+            return [results[i] for i in sorted(results)]
+            
+        except Exception as e:
+            logging.error(f"Error verifying announcements: {str(e)}")
+            raise
+    
+    def _build_result(
+        self,
+        company: str,
+        amount: float,
+        round_type: str,
+        date: str,
+        source_url: str,
+        extracted_details: ExtractedDetails,
+        source_reliability: SourceReliability
+    ) -> VerificationResult:
+        """Compare reported and extracted details and build the verification result."""
+        try:
             # Find discrepancies
             discrepancies = self._find_discrepancies(
                 reported={
@@ -54,83 +214,65 @@ class FundingVerifier:
                 overall_confidence=confidence_scores['overall']
             )
             
-            # Create verification notes
-            notes = self._generate_verification_notes(
-                status=status,
-                discrepancies=discrepancies,
-                source_reliability=source_reliability
+            return self._assemble_result(
+                company, amount, round_type, date, source_url, extracted_details,
+                source_reliability, discrepancies, confidence_scores['overall'], status
             )
             
-            # Create verification result
-            result = VerificationResult(
-                company_name=company,
-                verification_status=status,
-                overall_confidence=confidence_scores['overall'],
-                source_url=source_url,
-                source_reliability=source_reliability,
-                reported_details={
-                    'company': company,
-                    'amount': amount,
-                    'round_type': round_type,
-                    'date': date
-                },
-                extracted_details=extracted_details,
-                discrepancies=discrepancies,
-                verification_notes=notes
-            )
-            
-            return result.__dict__
-            
         except Exception as e:
-            logging.error(f"Error verifying announcement: {str(e)}")
+            logging.error(f"Error building verification result: {str(e)}")
             raise
     
+    def _assemble_result(
+        self,
+        company: str,
+        amount: float,
+        round_type: str,
+        date: str,
+        source_url: str,
+        extracted_details: ExtractedDetails,
+        source_reliability: SourceReliability,
+        discrepancies: List[Discrepancy],
+        overall_confidence: float,
+        status: str
+    ) -> VerificationResult:
+        """Build the verification result from already scored details."""
+        # Create verification notes
+        notes = self._generate_verification_notes(
+            status=status,
+            discrepancies=discrepancies,
+            source_reliability=source_reliability
+        )
+        
+        # Create verification result
+        return VerificationResult(
+            company_name=company,
+            verification_status=status,
+            overall_confidence=overall_confidence,
+            source_url=source_url,
+            source_reliability=source_reliability,
+            reported_details={
+                'company': company,
+                'amount': amount,
+                'round_type': round_type,
+                'date': date
+            },
+            extracted_details=extracted_details,
+            discrepancies=discrepancies,
+            verification_notes=notes
+        )
+    
     def _find_discrepancies(
         self,
         reported: Dict[str, Any],
         extracted: ExtractedDetails
     ) -> List[Discrepancy]:
-        """Find discrepancies between reported and extracted details."""
-        discrepancies = []
-        
-        # Compare company names
-        if reported['company'].lower() != extracted.company_name.lower():
-            discrepancies.append(Discrepancy(
-                field='company',
-                reported_value=reported['company'],
-                extracted_value=extracted.company_name,
-                impact=0.8  # High impact
-            ))
-        
-        # Compare amounts (allow 5% difference)
-        amount_diff = abs(reported['amount'] - extracted.amount) / reported['amount']
-        if amount_diff > 0.05:
-            discrepancies.append(Discrepancy(
-                field='amount',
-                reported_value=reported['amount'],
-                extracted_value=extracted.amount,
-                impact=0.6  # Medium-high impact
-            ))
+        """Find discrepancies between reported and extracted details.
         
-        # Compare round types
-        if reported['round_type'].lower() != extracted.round_type.lower():
-            discrepancies.append(Discrepancy(
-                field='round_type',
-                reported_value=reported['round_type'],
-                extracted_value=extracted.round_type,
-                impact=0.4  # Medium impact
-            ))
-        
-        # Compare dates
-        if reported['date'] != extracted.date:
-            discrepancies.append(Discrepancy(
-                field='date',
-                reported_value=reported['date'],
-                extracted_value=extracted.date,
-                impact=0.3  # Medium-low impact
-            ))
-        
-        return discrepancies
+        Memoised per pair of values, so an article seen again in a later batch
+        isn't compared again.
+        """
+        return find_discrepancies(reported, extracted)
     
     def _calculate_confidence_scores(
         self,
@@ -143,7 +285,14 @@ class FundingVerifier:
         
         # Calculate impact of discrepancies
         if discrepancies:
-            max_impact = max(d.impact for d in discrepancies)
+            # Impacts are bounded by 1, so a maximal one ends the scan: nothing
+            # later can lower the factor further
+            max_impact = 0.0
+            for d in discrepancies:
+                if d.impact > max_impact:
+                    max_impact = d.impact
+                    if max_impact >= 1.0:
+                        break
             discrepancy_factor = 1 - (max_impact * 0.8)  # Reduce confidence based on worst discrepancy
         else:
             discrepancy_factor = 1.0
@@ -157,14 +306,28 @@ class FundingVerifier:
             'overall': overall_confidence
         }
     
+    def score_results(
+        self,
+        source_reliabilities: List[SourceReliability],
+        discrepancies: List[List[Discrepancy]]
+    ) -> Tuple[List[float], List[str]]:
+        """Overall confidence and status of many results, computed as arrays with score_batch."""
+        scores, statuses = score_batch(
+            np.fromiter((sr.overall_score for sr in source_reliabilities), float, len(source_reliabilities)),
+            np.array([d.impact for ds in discrepancies for d in ds], dtype=float),
+            np.concatenate(([0], np.cumsum([len(ds) for ds in discrepancies]))),
+            self.confidence_thresholds['VERIFIED'],
+            self.confidence_thresholds['PARTIALLY_VERIFIED']
+        )
+        return scores.tolist(), [_STATUSES[code] for code in statuses]
+    
     def _determine_verification_status(self, overall_confidence: float) -> str:
         """Determine verification status based on confidence score."""
-        if overall_confidence >= self.confidence_thresholds['VERIFIED']:
-            return 'VERIFIED'
-        elif overall_confidence >= self.confidence_thresholds['PARTIALLY_VERIFIED']:
-            return 'PARTIALLY_VERIFIED'
-        else:
-            return 'UNVERIFIED'
+        thresholds = self.confidence_thresholds
+        return _STATUSES[
+            (overall_confidence >= thresholds['PARTIALLY_VERIFIED'])
+            + (overall_confidence >= thresholds['VERIFIED'])
+        ]
     
     def _generate_verification_notes(
         self,
@@ -173,27 +336,21 @@ class FundingVerifier:
         source_reliability: SourceReliability
     ) -> str:
         """Generate human-readable verification notes."""
-        notes = []
-        
-        # Add status note
-        notes.append(f"Verification Status: {status}")
-        
-        # Add source reliability note
-        notes.append(
+        # Status and source reliability notes
+        notes = (
+            f"Verification Status: {status}\n"
             f"Source Reliability: {source_reliability.domain} "
             f"({'Verified' if source_reliability.is_verified_publisher else 'Unverified'} publisher, "
             f"Score: {source_reliability.overall_score:.2f})"
         )
         
-        # Add discrepancy notes
-        if discrepancies:
-            notes.append("\nDiscrepancies found:")
-            for d in discrepancies:
-                notes.append(
-                    f"- {d.field.title()}: Reported '{d.reported_value}' vs. "
-                    f"Extracted '{d.extracted_value}' (Impact: {d.impact:.2f})"
-                )
-        else:
-            notes.append("\nNo discrepancies found.")
+        # Discrepancy notes
+        if not discrepancies:
+            return f"{notes}\n\nNo discrepancies found."
         
-        return "\n".join(notes) 
\ No newline at end of file
+        details = "\n".join([
+            f"- {d.field.title()}: Reported '{d.reported_value}' vs. "
+            f"Extracted '{d.extracted_value}' (Impact: {d.impact:.2f})"
+            for d in discrepancies
+        ])
+        return f"{notes}\n\nDiscrepancies found:\n{details}" 
\ No newline at end of file
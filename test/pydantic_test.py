@@ -1,8 +1,9 @@
+import asyncio
 import os
+from dataclasses import dataclass
 from typing import cast
 
 import logfire
-from pydantic import BaseModel
 
 from pydantic_ai import Agent
 from pydantic_ai.models import KnownModelName
@@ -11,8 +12,10 @@ from prompt import SEARCH_NEWSLINK
 logfire.configure(send_to_logfire='if-token-present')
 
 
-class NewslinkAnswer(BaseModel):
-    
+# A plain dataclass: the agent builds its validator once, and the answers
+# don't pay for BaseModel instances
+@dataclass(slots=True)
+class NewslinkAnswer:
     is_valid: bool
     reasoning: str
 
@@ -23,14 +26,16 @@ print(f'Using model: {model}')
 
 agent = Agent(model, result_type=NewslinkAnswer, num_results=3)
 
-def verify_newslink(newslink: str) -> tuple[bool, str]:
+async def verify_newslinks(newslinks: list[str]) -> list[tuple[bool, str]]:
+    """Verify many news links at once, overlapping the model round-trips on the event loop."""
+    results = await asyncio.gather(*(agent.run(newslink) for newslink in newslinks))
 
-    prompt = ""
-    
-    result = agent.run_sync('The windy city in the US of A.')
-    
-    print(result.data)
-    print(result.usage())
+    answers = []
+    for result in results:
+        print(result.data)
+        print(result.usage())
+        answers.append((result.data.is_valid, result.data.reasoning))
+    return answers
 
-    answer = result.data
-    return answer.is_valid, answer.reasoning
\ No newline at end of file
+def verify_newslink(newslink: str) -> tuple[bool, str]:
+    return asyncio.run(verify_newslinks([newslink]))[0]
\ No newline at end of file
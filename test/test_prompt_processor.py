@@ -0,0 +1,24 @@
+import pandas as pd
+
+from src.prompt_processor import PROMPT_FOOTER, PROMPT_HEADER, generate_prompts
+
+
+def test_generate_prompts_builds_one_prompt_per_row():
+    df = pd.DataFrame({'Name': ['Acme'], 'Amount (USD M)': [5.0], 'News link': [None]})
+
+    result = generate_prompts(df)
+
+    assert result['prompt'][0] == (
+        f"{PROMPT_HEADER}- Name: Acme\n- Amount (USD M): 5.0\n- News link: None\n{PROMPT_FOOTER}"
+    )
+    assert 'prompt' not in df.columns
+
+
+def test_generate_prompts_on_empty_frame():
+    df = pd.DataFrame({'Name': pd.Series(dtype=str), 'Amount (USD M)': pd.Series(dtype=float)})
+
+    result = generate_prompts(df)
+
+    assert result is not None
+    assert result.empty
+    assert list(result.columns) == ['Name', 'Amount (USD M)', 'prompt']